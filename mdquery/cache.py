@@ -7,6 +7,7 @@ support, and cleanup of deleted files and orphaned entries.
 """
 
 import logging
+import os
 import sqlite3
 from datetime import datetime, timedelta
 from pathlib import Path
@@ -151,7 +152,7 @@ class CacheManager:
                     conn.execute("DELETE FROM files WHERE id = ?", (file_id,))
 
                     # Also remove from FTS5 table explicitly
-                    conn.execute("DELETE FROM content_fts WHERE file_id = ?", (file_id,))
+                    conn.execute("DELETE FROM content_fts WHERE rowid = ?", (file_id,))
 
                     conn.commit()
                     logger.debug(f"Invalidated file from cache: {file_path}")
@@ -197,6 +198,37 @@ class CacheManager:
         except Exception as e:
             raise CacheError(f"Failed to invalidate directory {directory_path}: {e}") from e
 
+    def _file_exists(self, file_path: str, listings: Dict[str, Optional[Dict[str, bool]]]) -> bool:
+        """
+        Check whether an indexed file still exists, listing each directory once.
+
+        A regular entry in its directory's listing proves the file exists
+        without a stat() call. Symlinks (which may dangle), names missing from
+        the listing and unreadable directories are checked individually.
+
+        Args:
+            file_path: Path of the indexed file
+            listings: Cache mapping directories to {name: is_symlink}, or None
+                if the directory could not be listed
+
+        Returns:
+            True if the file exists
+        """
+        directory, name = os.path.split(file_path)
+
+        if directory not in listings:
+            try:
+                with os.scandir(directory or '.') as entries:
+                    listings[directory] = {entry.name: entry.is_symlink() for entry in entries}
+            except OSError:
+                listings[directory] = None
+
+        listing = listings[directory]
+        if listing is not None and listing.get(name) is False:
+            return True
+
+        return Path(file_path).exists()
+
     def cleanup_orphaned_entries(self) -> Dict[str, int]:
         """
         Clean up orphaned entries for files that no longer exist on disk.
@@ -226,13 +258,14 @@ class CacheManager:
                 db_files = cursor.fetchall()
 
                 orphaned_file_ids = []
+                listings = {}
 
                 for row in db_files:
                     file_id, file_path = row['id'], row['path']
                     stats['files_checked'] += 1
 
                     # Check if file still exists
-                    if not Path(file_path).exists():
+                    if not self._file_exists(file_path, listings):
                         orphaned_file_ids.append(file_id)
                         logger.debug(f"Found orphaned file: {file_path}")
 
@@ -248,7 +281,7 @@ class CacheManager:
                         cursor = conn.execute("SELECT COUNT(*) FROM links WHERE file_id = ?", (file_id,))
                         stats['orphaned_links'] += cursor.fetchone()[0]
 
-                        cursor = conn.execute("SELECT COUNT(*) FROM content_fts WHERE file_id = ?", (file_id,))
+                        cursor = conn.execute("SELECT COUNT(*) FROM content_fts WHERE rowid = ?", (file_id,))
                         stats['orphaned_fts'] += cursor.fetchone()[0]
 
                     # Delete orphaned files (cascading deletes will handle related tables)
@@ -256,7 +289,7 @@ class CacheManager:
                     conn.execute(f"DELETE FROM files WHERE id IN ({placeholders})", orphaned_file_ids)
 
                     # Explicitly clean FTS5 table
-                    conn.execute(f"DELETE FROM content_fts WHERE file_id IN ({placeholders})", orphaned_file_ids)
+                    conn.execute(f"DELETE FROM content_fts WHERE rowid IN ({placeholders})", orphaned_file_ids)
 
                     stats['files_removed'] = len(orphaned_file_ids)
                     conn.commit()
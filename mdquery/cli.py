@@ -1430,8 +1430,11 @@ if __name__ == '__main__':
               help='Perform incremental indexing (only modified files)')
 @click.option('--force', is_flag=True,
               help='Force full reindex even if cache exists')
+@click.option('--workers', '-w', type=click.IntRange(min=0), default=1,
+              help='Worker processes for parsing on full indexing (0 = CPU cores minus one)')
 @click.pass_context
-def index(ctx: click.Context, directory: Path, recursive: bool, incremental: bool, force: bool):
+def index(ctx: click.Context, directory: Path, recursive: bool, incremental: bool, force: bool,
+          workers: int):
     """Index markdown files in a directory.
 
     Scans the specified directory for markdown files and creates a searchable index.
@@ -1441,6 +1444,7 @@ def index(ctx: click.Context, directory: Path, recursive: bool, incremental: boo
       mdquery index ./notes
       mdquery index ./docs --no-recursive
       mdquery index ./blog --full --force
+      mdquery index ./vault --full --workers 0
     """
     verbose = ctx.obj.get('verbose', False)
 
@@ -1462,13 +1466,13 @@ def index(ctx: click.Context, directory: Path, recursive: bool, incremental: boo
         # Determine indexing strategy
         if force:
             click.echo(f"Force rebuilding index for: {directory}")
-            stats = indexer.rebuild_index(directory)
+            stats = indexer.rebuild_index(directory, workers=workers)
         elif incremental:
             click.echo(f"Incrementally indexing: {directory} (recursive={recursive})")
             stats = indexer.incremental_index_directory(directory, recursive)
         else:
             click.echo(f"Full indexing: {directory} (recursive={recursive})")
-            stats = indexer.index_directory(directory, recursive)
+            stats = indexer.index_directory(directory, recursive, workers=workers)
 
         # Display results
         click.echo(f"\nIndexing complete:")
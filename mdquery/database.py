@@ -7,9 +7,10 @@ and migrations for the mdquery SQLite database with FTS5 support.
 
 import sqlite3
 import logging
+import threading
 import time
 from pathlib import Path
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Tuple
 from contextlib import contextmanager
 
 from .exceptions import (
@@ -29,7 +30,7 @@ class DatabaseManager:
     """
 
     # Current schema version
-    SCHEMA_VERSION = 2
+    SCHEMA_VERSION = 3
 
     def __init__(self, db_path: Optional[Path] = None):
         """
@@ -41,6 +42,43 @@ class DatabaseManager:
         self.db_path = db_path or ":memory:"
         self._connection: Optional[sqlite3.Connection] = None
 
+        # File databases get one connection per thread, so a transaction or
+        # rollback on one thread never affects another thread's work.
+        # In-memory databases exist only within a single connection, so they
+        # keep using self._connection from every thread.
+        self._local = threading.local()
+        self._thread_connections: List[sqlite3.Connection] = []
+        self._connections_lock = threading.Lock()
+
+        # Table columns and catalog SQL, keyed on SQLite's schema cookie
+        # (PRAGMA schema_version), which changes whenever any connection
+        # alters the schema
+        self._schema_structure: Optional[Tuple[int, Dict[str, Any]]] = None
+
+    def _get_thread_connection(self) -> sqlite3.Connection:
+        """
+        Get the connection for the calling thread, creating it on first use.
+
+        Returns:
+            sqlite3.Connection: Connection owned by the calling thread, or the
+            shared connection for in-memory databases
+
+        Raises:
+            DatabaseConnectionError: If connection cannot be established
+        """
+        if str(self.db_path) == ":memory:":
+            if self._connection is None:
+                self._connection = self._create_connection()
+            return self._connection
+
+        connection = getattr(self._local, 'connection', None)
+        if connection is None:
+            connection = self._create_connection()
+            self._local.connection = connection
+            with self._connections_lock:
+                self._thread_connections.append(connection)
+        return connection
+
     @contextmanager
     def get_connection(self):
         """
@@ -53,13 +91,13 @@ class DatabaseManager:
             DatabaseConnectionError: If connection cannot be established
             DatabaseCorruptionError: If database corruption is detected
         """
-        if self._connection is None:
-            self._connection = self._create_connection()
+        connection = self._get_thread_connection()
 
         try:
-            # Test connection health
-            self._connection.execute("SELECT 1").fetchone()
-            yield self._connection
+            # The connection is reused for the life of the thread; it was
+            # checked when created (pragmas and FTS5 probe), and a statement
+            # that fails later is reported below
+            yield connection
         except sqlite3.DatabaseError as e:
             if "database disk image is malformed" in str(e).lower():
                 error = DatabaseCorruptionError(f"Database corruption detected: {e}")
@@ -71,7 +109,7 @@ class DatabaseManager:
                 raise error from e
         except Exception as e:
             try:
-                self._connection.rollback()
+                connection.rollback()
             except Exception:
                 pass  # Ignore rollback errors
 
@@ -110,6 +148,7 @@ class DatabaseManager:
                     conn.execute("PRAGMA synchronous = NORMAL")  # Balance safety and performance
                     conn.execute("PRAGMA temp_store = MEMORY")  # Use memory for temp storage
                     conn.execute("PRAGMA cache_size = -64000")  # 64MB cache
+                    conn.execute("PRAGMA mmap_size = 268435456")  # Memory-map up to 256MB for reads
                 except sqlite3.Error as e:
                     logger.warning(f"Failed to set some PRAGMA options: {e}")
 
@@ -258,7 +297,8 @@ class DatabaseManager:
             )
         """)
 
-        # FTS5 virtual table for full-text search
+        # FTS5 virtual table for full-text search. Each row's rowid is its
+        # file_id, so a file's row is found without scanning the table
         conn.execute("""
             CREATE VIRTUAL TABLE content_fts USING fts5(
                 file_id UNINDEXED,
@@ -460,9 +500,8 @@ class DatabaseManager:
         """
         migrations = {
             2: self._migrate_to_version_2,
+            3: self._migrate_to_version_3,
             # Future migrations will be added here
-            # Example:
-            # 3: self._migrate_to_version_3,
         }
 
         for version in range(from_version + 1, self.SCHEMA_VERSION + 1):
@@ -499,6 +538,31 @@ class DatabaseManager:
                 if "already exists" not in str(e):
                     raise
 
+    def _migrate_to_version_3(self, conn: sqlite3.Connection) -> None:
+        """Migrate database to version 3 - Key full-text rows by file id."""
+        cursor = conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'content_fts'"
+        )
+        if cursor.fetchone() is None:
+            return
+
+        logger.info("Re-keying full-text search rows by file id")
+
+        # Keep the newest row of each file that is still indexed; rows left
+        # behind by re-indexed or removed files are dropped
+        conn.execute("""
+            CREATE TEMP TABLE fts_rows AS
+            SELECT file_id, title, content, headings FROM content_fts
+            WHERE rowid IN (SELECT MAX(rowid) FROM content_fts GROUP BY file_id)
+            AND file_id IN (SELECT id FROM files)
+        """)
+        conn.execute("DELETE FROM content_fts")
+        conn.execute("""
+            INSERT INTO content_fts (rowid, file_id, title, content, headings)
+            SELECT file_id, file_id, title, content, headings FROM temp.fts_rows
+        """)
+        conn.execute("DROP TABLE temp.fts_rows")
+
     def get_schema_info(self) -> Dict[str, Any]:
         """
         Get database schema information.
@@ -507,26 +571,62 @@ class DatabaseManager:
             Dict containing schema version, table info, and statistics
         """
         with self.get_connection() as conn:
+            structure = self._get_schema_structure(conn)
+
             schema_info = {
                 "version": self._get_schema_version(conn),
                 "tables": {},
-                "views": {},
-                "indexes": []
+                "views": {
+                    name: dict(view)
+                    for name, view in structure["views"].items()
+                },
+                "indexes": [dict(index) for index in structure["indexes"]]
             }
 
-            # Get table information
-            cursor = conn.execute("""
-                SELECT name, sql FROM sqlite_master
-                WHERE type = 'table' AND name NOT LIKE 'sqlite_%'
-                ORDER BY name
-            """)
+            # Row counts change with every write, so they are never cached
+            for table_name, table in structure["tables"].items():
+                count_cursor = conn.execute(f"SELECT COUNT(*) FROM {table_name}")
+                row_count = count_cursor.fetchone()[0]
+
+                schema_info["tables"][table_name] = {
+                    "columns": [dict(col) for col in table["columns"]],
+                    "row_count": row_count,
+                    "sql": table["sql"]
+                }
+
+            return schema_info
+
+    def _get_schema_structure(self, conn: sqlite3.Connection) -> Dict[str, Any]:
+        """
+        Get table columns, views and indexes, reusing the last introspection.
 
-            for row in cursor.fetchall():
-                table_name = row["name"]
+        Args:
+            conn: Connection to introspect
 
-                # Get column info
-                col_cursor = conn.execute(f"PRAGMA table_info({table_name})")
-                columns = [
+        Returns:
+            Dict with "tables", "views" and "indexes" entries
+        """
+        cookie = conn.execute("PRAGMA schema_version").fetchone()[0]
+        cached = self._schema_structure
+        if cached is not None and cached[0] == cookie:
+            return cached[1]
+
+        structure = {"tables": {}, "views": {}, "indexes": []}
+
+        # Get table information
+        cursor = conn.execute("""
+            SELECT name, sql FROM sqlite_master
+            WHERE type = 'table' AND name NOT LIKE 'sqlite_%'
+            ORDER BY name
+        """)
+
+        for row in cursor.fetchall():
+            table_name = row["name"]
+
+            # Get column info
+            col_cursor = conn.execute(f"PRAGMA table_info({table_name})")
+            structure["tables"][table_name] = {
+                "columns": [
                     {
                         "name": col["name"],
                         "type": col["type"],
@@ -534,43 +634,36 @@ class DatabaseManager:
                         "primary_key": bool(col["pk"])
                     }
                     for col in col_cursor.fetchall()
-                ]
-
-                # Get row count
-                count_cursor = conn.execute(f"SELECT COUNT(*) FROM {table_name}")
-                row_count = count_cursor.fetchone()[0]
-
-                schema_info["tables"][table_name] = {
-                    "columns": columns,
-                    "row_count": row_count,
-                    "sql": row["sql"]
-                }
+                ],
+                "sql": row["sql"]
+            }
 
-            # Get view information
-            cursor = conn.execute("""
-                SELECT name, sql FROM sqlite_master
-                WHERE type = 'view'
-                ORDER BY name
-            """)
+        # Get view information
+        cursor = conn.execute("""
+            SELECT name, sql FROM sqlite_master
+            WHERE type = 'view'
+            ORDER BY name
+        """)
 
-            for row in cursor.fetchall():
-                schema_info["views"][row["name"]] = {
-                    "sql": row["sql"]
-                }
+        for row in cursor.fetchall():
+            structure["views"][row["name"]] = {
+                "sql": row["sql"]
+            }
 
-            # Get index information
-            cursor = conn.execute("""
-                SELECT name, sql FROM sqlite_master
-                WHERE type = 'index' AND name NOT LIKE 'sqlite_%'
-                ORDER BY name
-            """)
+        # Get index information
+        cursor = conn.execute("""
+            SELECT name, sql FROM sqlite_master
+            WHERE type = 'index' AND name NOT LIKE 'sqlite_%'
+            ORDER BY name
+        """)
 
-            schema_info["indexes"] = [
-                {"name": row["name"], "sql": row["sql"]}
-                for row in cursor.fetchall()
-            ]
+        structure["indexes"] = [
+            {"name": row["name"], "sql": row["sql"]}
+            for row in cursor.fetchall()
+        ]
 
-            return schema_info
+        self._schema_structure = (cookie, structure)
+        return structure
 
     def validate_schema(self) -> bool:
         """
@@ -612,12 +705,22 @@ class DatabaseManager:
             return False
 
     def close(self) -> None:
-        """Close database connection."""
+        """Close database connections for all threads."""
         if self._connection:
             self._connection.close()
             self._connection = None
             logger.debug("Database connection closed")
 
+        with self._connections_lock:
+            connections, self._thread_connections = self._thread_connections, []
+        for connection in connections:
+            connection.close()
+        if connections:
+            logger.debug(f"Closed {len(connections)} thread database connection(s)")
+
+        # Threads holding a closed connection open a new one on next use
+        self._local = threading.local()
+
     def __enter__(self):
         """Context manager entry."""
         return self
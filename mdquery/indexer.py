@@ -4,11 +4,17 @@ File indexing engine for scanning and processing markdown files.
 
 import hashlib
 import logging
+import mmap
 import os
 import psutil
+import stat
+import threading
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Set, Any
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple, Any
 
 from .database import DatabaseManager
 from .models import FileMetadata, ParsedContent
@@ -26,20 +32,70 @@ from .logging_config import performance_timer, monitor_performance, log_error
 
 logger = logging.getLogger(__name__)
 
+# Per-process indexer used by worker processes of Indexer.index_directory
+_worker_indexer = None
+
+
+def _init_index_worker(fast_hash: bool) -> None:
+    """
+    Initialize the indexer of a worker process.
+
+    Args:
+        fast_hash: Whether content is fingerprinted with xxHash
+    """
+    global _worker_indexer
+    _worker_indexer = Indexer(None, fast_hash=fast_hash)
+
+
+def _load_file_for_index(path: str, file_stat: os.stat_result) -> Tuple[
+        Optional[Tuple[FileMetadata, ParsedContent]], Optional[Exception]]:
+    """
+    Worker entry point that reads and parses one file for indexing.
+
+    Defined at module level so it can be pickled by multiprocessing. Errors
+    are returned rather than raised so one bad file does not abort the batch.
+
+    Args:
+        path: Path of the markdown file
+        file_stat: Stat result of the file from the directory scan
+
+    Returns:
+        Tuple of ((file metadata, parsed content), None) on success, or
+        (None, error) on failure
+    """
+    try:
+        return _worker_indexer._load_file(Path(path), file_stat), None
+    except Exception as e:
+        return None, e
+
 
 class Indexer:
     """Main indexing engine for processing markdown files and populating the database."""
 
-    def __init__(self, database_manager: DatabaseManager, cache_manager: Optional[CacheManager] = None):
+    def __init__(self, database_manager: DatabaseManager, cache_manager: Optional[CacheManager] = None,
+                 fast_hash: bool = False):
         """
         Initialize the indexer with database manager and parsers.
 
         Args:
             database_manager: Database manager instance for database operations
             cache_manager: Optional cache manager for incremental indexing support
+            fast_hash: Fingerprint file content with xxHash (XXH3-128) instead of
+                SHA-256 when the optional xxhash package is installed
         """
         self.db_manager = database_manager
         self.cache_manager = cache_manager
+        self.fast_hash = fast_hash
+
+        # Content hashes are only compared for equality, so a non-cryptographic
+        # hash is sufficient when requested
+        self.hash_factory = hashlib.sha256
+        if fast_hash:
+            try:
+                import xxhash
+                self.hash_factory = xxhash.xxh3_128
+            except ImportError:
+                logger.warning("xxhash is not installed, falling back to SHA-256 content hashes")
 
         # Initialize parsers
         self.frontmatter_parser = FrontmatterParser()
@@ -48,8 +104,14 @@ class Indexer:
         self.link_parser = LinkParser()
         self.obsidian_parser = ObsidianParser()
 
+        # Connection holding the open transaction while a batch of files is
+        # written (see _batched_writes). Connections are per thread, so each
+        # thread tracks its own batch
+        self._batch_state = threading.local()
+
         # Supported file extensions
         self.markdown_extensions = {'.md', '.markdown', '.mdown', '.mkd', '.mkdn', '.mdx'}
+        self._ext_tuple = tuple(self.markdown_extensions)
 
         # Statistics tracking
         self.stats = {
@@ -60,13 +122,18 @@ class Indexer:
         }
 
     @monitor_performance('directory_indexing')
-    def index_directory(self, path: Path, recursive: bool = True) -> Dict[str, int]:
+    def index_directory(self, path: Path, recursive: bool = True,
+                        workers: Optional[int] = 1) -> Dict[str, int]:
         """
         Recursively scan directory and index all markdown files.
 
         Args:
             path: Directory path to scan
             recursive: Whether to scan subdirectories
+            workers: Number of worker processes used to read and parse changed
+                files. 1 processes files in the calling process, None uses one
+                fewer than the CPU count, leaving a core for the database
+                writes, which always happen in the caller.
 
         Returns:
             Dictionary with indexing statistics
@@ -97,27 +164,43 @@ class Indexer:
         try:
             # Scan for markdown files
             with performance_timer('directory_scan', logger):
-                markdown_files = self._scan_directory(path, recursive)
+                markdown_entries = self._scan_directory_entries(path, recursive)
 
-            logger.info(f"Found {len(markdown_files)} markdown files to process")
+            logger.info(f"Found {len(markdown_entries)} markdown files to process")
 
-            # Process each file with error handling
-            for file_path in markdown_files:
-                try:
-                    if self._should_index_file(file_path):
-                        self.index_file(file_path)
-                        self.stats['files_processed'] += 1
-                    else:
-                        self.stats['files_skipped'] += 1
-                        logger.debug(f"Skipped file (no changes): {file_path}")
-                except (FileAccessError, FileCorruptedError, ParsingError) as e:
-                    self.stats['errors'] += 1
-                    log_error(e, logger, {'operation': 'file_indexing', 'file_path': str(file_path)})
-                except Exception as e:
-                    self.stats['errors'] += 1
-                    # Wrap unexpected errors
-                    wrapped_error = IndexingError(f"Unexpected error indexing file: {e}", file_path=file_path)
-                    log_error(wrapped_error, logger, {'operation': 'file_indexing', 'file_path': str(file_path)})
+            if not workers:
+                workers = max(1, (os.cpu_count() or 1) - 1)
+            manifest = self._get_index_manifest(path)
+            self._prefetch_entry_stats(markdown_entries)
+
+            # Process each file with error handling, committing once at the end
+            with self._batched_writes():
+                pending = []
+                for entry in markdown_entries:
+                    file_path = Path(entry.path)
+                    try:
+                        # DirEntry caches its stat result, so the change check and
+                        # the metadata extraction share a single stat() call
+                        file_stat = entry.stat()
+                        needs_indexing, dates_stale = self._check_file_status(
+                            file_path, manifest.get(str(file_path)), file_stat
+                        )
+                        if needs_indexing:
+                            pending.append((file_path, file_stat))
+                        else:
+                            if dates_stale:
+                                # Touched but not edited: record the new timestamps
+                                # instead of parsing and rewriting the file's rows
+                                self._refresh_file_dates(file_path, file_stat)
+                            self.stats['files_skipped'] += 1
+                            logger.debug(f"Skipped file (no changes): {file_path}")
+                    except Exception as e:
+                        self._record_file_error(file_path, e)
+
+                if workers == 1:
+                    self._index_files_prefetched(pending)
+                else:
+                    self._index_files_parallel(pending, workers)
 
             logger.info(f"Directory indexing complete. Stats: {self.stats}")
             return self.stats.copy()
@@ -132,12 +215,14 @@ class Indexer:
             raise wrapped_error from e
 
     @monitor_performance('file_indexing')
-    def index_file(self, file_path: Path) -> bool:
+    def index_file(self, file_path: Path, file_stat: Optional[os.stat_result] = None) -> bool:
         """
         Index a single markdown file.
 
         Args:
             file_path: Path to the markdown file to index
+            file_stat: Optional stat result already fetched for the file,
+                e.g. from a directory scan
 
         Returns:
             True if file was indexed successfully, False otherwise
@@ -147,52 +232,245 @@ class Indexer:
             FileCorruptedError: If file is corrupted or can't be processed
             ParsingError: If file parsing fails
         """
-        if not file_path.exists():
-            raise FileAccessError(f"File does not exist: {file_path}", file_path=file_path)
+        file_metadata, parsed_content = self._load_file(file_path, file_stat)
 
-        if not file_path.is_file():
-            raise FileAccessError(f"Path is not a file: {file_path}", file_path=file_path)
+        # Store in database with error handling
+        try:
+            self._store_file_data(file_metadata, parsed_content)
+        except Exception as e:
+            raise IndexingError(f"Failed to store file data: {e}", file_path=file_path) from e
 
-        if file_path.suffix.lower() not in self.markdown_extensions:
-            raise FileAccessError(f"File is not a markdown file: {file_path}", file_path=file_path)
+        logger.debug(f"Successfully indexed: {file_path}")
+        return True
 
-        logger.debug(f"Indexing file: {file_path}")
+    def _load_file(self, file_path: Path, file_stat: Optional[os.stat_result] = None,
+                   raw: Optional[bytes] = None) -> Tuple[FileMetadata, ParsedContent]:
+        """
+        Validate, read and parse a markdown file without touching the database.
+
+        Args:
+            file_path: Path to the markdown file
+            file_stat: Optional stat result already fetched for the file
+            raw: Optional file bytes already read, used for both the content
+                hash and the text instead of reading the file again
 
+        Returns:
+            Tuple of (file metadata, parsed content)
+
+        Raises:
+            FileAccessError: If file doesn't exist or can't be accessed
+            FileCorruptedError: If file is corrupted or can't be processed
+            ParsingError: If file parsing fails
+        """
         try:
-            # Extract file metadata with error handling
-            try:
-                file_metadata = self._extract_file_metadata(file_path)
-            except (OSError, PermissionError) as e:
-                raise FileAccessError(f"Cannot access file metadata: {e}", file_path=file_path) from e
+            if file_stat is None:
+                try:
+                    file_stat = os.stat(file_path)
+                except (FileNotFoundError, NotADirectoryError):
+                    raise FileAccessError(f"File does not exist: {file_path}", file_path=file_path)
+                except OSError as e:
+                    raise FileAccessError(f"Cannot access file metadata: {e}", file_path=file_path) from e
 
-            # Read and parse file content with error handling
-            try:
-                content = self._read_file_content(file_path)
-            except (OSError, PermissionError) as e:
-                raise FileAccessError(f"Cannot read file content: {e}", file_path=file_path) from e
-            except UnicodeDecodeError as e:
-                raise FileCorruptedError(f"Cannot decode file content: {e}", file_path=file_path) from e
+            if not stat.S_ISREG(file_stat.st_mode):
+                raise FileAccessError(f"Path is not a file: {file_path}", file_path=file_path)
+
+            if file_path.suffix.lower() not in self.markdown_extensions:
+                raise FileAccessError(f"File is not a markdown file: {file_path}", file_path=file_path)
+
+            logger.debug(f"Indexing file: {file_path}")
 
             try:
-                parsed_content = self._parse_content(content, file_path)
+                # Read the file once; the same bytes feed the hash and the parser
+                if raw is None:
+                    try:
+                        raw = self._read_file_bytes(file_path, file_stat.st_size)
+                    except (OSError, PermissionError) as e:
+                        raise FileAccessError(f"Cannot read file content: {e}", file_path=file_path) from e
+
+                # Extract file metadata with error handling
+                try:
+                    file_metadata = self._extract_file_metadata(
+                        file_path, file_stat, self.hash_factory(raw).hexdigest()
+                    )
+                except (OSError, PermissionError) as e:
+                    raise FileAccessError(f"Cannot access file metadata: {e}", file_path=file_path) from e
+
+                # Decode file content with error handling
+                try:
+                    content = self._decode_content(raw, file_path)
+                except UnicodeDecodeError as e:
+                    raise FileCorruptedError(f"Cannot decode file content: {e}", file_path=file_path) from e
+
+                # Parse file content with error handling
+
+                try:
+                    parsed_content = self._parse_content(content, file_path)
+                except Exception as e:
+                    raise ParsingError(f"Failed to parse file content: {e}", file_path=file_path) from e
+
+                return file_metadata, parsed_content
+
+            except (FileAccessError, FileCorruptedError, ParsingError, IndexingError):
+                # Re-raise known errors
+                raise
             except Exception as e:
-                raise ParsingError(f"Failed to parse file content: {e}", file_path=file_path) from e
+                # Wrap unexpected errors
+                raise IndexingError(f"Unexpected error indexing file: {e}", file_path=file_path) from e
+        finally:
+            # Large files arrive as memory maps, possibly prefetched before
+            # this call; release the map on every exit, validation included
+            if isinstance(raw, mmap.mmap):
+                raw.close()
+
+    def _index_files_parallel(self, files: List[Tuple[Path, os.stat_result]], workers: int) -> None:
+        """
+        Read and parse files in worker processes and store them in this one.
+
+        Parsing is CPU bound and holds the GIL, so it is spread across a
+        process pool while the database writes stay on the calling thread.
 
-            # Store in database with error handling
+        Args:
+            files: Tuples of (file path, stat result) to index
+            workers: Number of worker processes
+        """
+        # Pool start-up costs more than parsing a single file
+        if len(files) < 2:
+            self._index_files_prefetched(files)
+            return
+
+        paths = [str(file_path) for file_path, _ in files]
+        file_stats = [file_stat for _, file_stat in files]
+        chunksize = max(1, min(32, len(files) // (workers * 4)))
+
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_index_worker,
+                                 initargs=(self.fast_hash,)) as executor:
+            results = executor.map(_load_file_for_index, paths, file_stats, chunksize=chunksize)
+
+            for (file_path, _), (loaded, error) in zip(files, results):
+                if error is None:
+                    try:
+                        self._store_file_data(*loaded)
+                        logger.debug(f"Successfully indexed: {file_path}")
+                        self.stats['files_processed'] += 1
+                        continue
+                    except Exception as e:
+                        error = IndexingError(f"Failed to store file data: {e}", file_path=file_path)
+
+                self._record_file_error(file_path, error)
+
+    def _index_files_prefetched(self, files: List[Tuple[Path, os.stat_result]]) -> None:
+        """
+        Index files in this process while their bytes are read ahead.
+
+        Args:
+            files: Tuples of (file path, stat result) to index
+        """
+        contents = self._prefetch_file_bytes(file_path for file_path, _ in files)
+
+        for (file_path, file_stat), (raw, read_error) in zip(files, contents):
             try:
-                self._store_file_data(file_metadata, parsed_content)
+                if read_error is not None:
+                    raise FileAccessError(f"Cannot read file content: {read_error}",
+                                          file_path=file_path) from read_error
+
+                file_metadata, parsed_content = self._load_file(file_path, file_stat, raw)
+                try:
+                    self._store_file_data(file_metadata, parsed_content)
+                except Exception as e:
+                    raise IndexingError(f"Failed to store file data: {e}", file_path=file_path) from e
+
+                logger.debug(f"Successfully indexed: {file_path}")
+                self.stats['files_processed'] += 1
             except Exception as e:
-                raise IndexingError(f"Failed to store file data: {e}", file_path=file_path) from e
+                self._record_file_error(file_path, e)
 
-            logger.debug(f"Successfully indexed: {file_path}")
-            return True
+    def _prefetch_file_bytes(self, paths: Iterable[Path],
+                             depth: int = 64) -> Iterator[Tuple[Optional[bytes], Optional[OSError]]]:
+        """
+        Read files on background threads, up to depth files ahead of the consumer.
 
-        except (FileAccessError, FileCorruptedError, ParsingError, IndexingError):
-            # Re-raise known errors
-            raise
-        except Exception as e:
+        File reads release the GIL, so disk latency overlaps with parsing of
+        the files already read.
+
+        Args:
+            paths: Files to read, in the order they will be consumed
+            depth: Maximum number of files read ahead
+
+        Yields:
+            Tuple of (file bytes, None), or (None, error) if a file cannot be read
+        """
+        read_bytes = self._read_file_bytes
+        paths = iter(paths)
+        with ThreadPoolExecutor(max_workers=4, thread_name_prefix='mdquery-prefetch') as executor:
+            pending = deque(executor.submit(read_bytes, path) for _, path in zip(range(depth), paths))
+
+            try:
+                while pending:
+                    future = pending.popleft()
+                    next_path = next(paths, None)
+                    if next_path is not None:
+                        pending.append(executor.submit(read_bytes, next_path))
+
+                    try:
+                        yield future.result(), None
+                    except OSError as e:
+                        yield None, e
+            finally:
+                # The consumer stopped early; release maps read ahead for
+                # files it never reached
+                while pending:
+                    future = pending.popleft()
+                    if future.cancel():
+                        continue
+                    try:
+                        data = future.result()
+                    except OSError:
+                        continue
+                    if isinstance(data, mmap.mmap):
+                        data.close()
+
+    def _prefetch_entry_stats(self, entries: List[os.DirEntry], chunk_size: int = 256) -> None:
+        """
+        Fill the stat cache of scanned entries on background threads.
+
+        Directory reads only report file types, so each entry still costs a
+        stat() call. The calls release the GIL, so on a cold cache issuing
+        them from a few threads at once overlaps their disk latency. Entries
+        are handed out in chunks to keep the threading overhead low on a warm
+        cache, and small scans are left to the caller.
+
+        Args:
+            entries: Scanned entries; entry.stat() is then answered from cache
+            chunk_size: Number of entries stat'ed per task
+        """
+        if len(entries) <= chunk_size:
+            return
+
+        def stat_chunk(chunk: List[os.DirEntry]) -> None:
+            for entry in chunk:
+                try:
+                    entry.stat()
+                except OSError:
+                    # Reported when the caller stats the entry itself
+                    pass
+
+        chunks = [entries[i:i + chunk_size] for i in range(0, len(entries), chunk_size)]
+        with ThreadPoolExecutor(max_workers=4, thread_name_prefix='mdquery-stat') as executor:
+            list(executor.map(stat_chunk, chunks))
+
+    def _record_file_error(self, file_path: Path, error: Exception) -> None:
+        """
+        Count and log an error for a single file during directory indexing.
+
+        Args:
+            file_path: File that failed
+            error: Error raised while indexing the file
+        """
+        self.stats['errors'] += 1
+        if not isinstance(error, (FileAccessError, FileCorruptedError, ParsingError)):
             # Wrap unexpected errors
-            raise IndexingError(f"Unexpected error indexing file: {e}", file_path=file_path) from e
+            error = IndexingError(f"Unexpected error indexing file: {error}", file_path=file_path)
+        log_error(error, logger, {'operation': 'file_indexing', 'file_path': str(file_path)})
 
     def update_index(self, file_path: Path) -> bool:
         """
@@ -206,12 +484,14 @@ class Indexer:
         """
         return self.index_file(file_path)
 
-    def rebuild_index(self, directory: Path) -> Dict[str, int]:
+    def rebuild_index(self, directory: Path, workers: Optional[int] = 1) -> Dict[str, int]:
         """
         Rebuild the entire index for a directory.
 
         Args:
             directory: Directory to rebuild index for
+            workers: Number of worker processes used to parse files, as for
+                index_directory
 
         Returns:
             Dictionary with rebuild statistics
@@ -222,7 +502,7 @@ class Indexer:
         self._clear_directory_data(directory)
 
         # Reindex everything
-        return self.index_directory(directory, recursive=True)
+        return self.index_directory(directory, recursive=True, workers=workers)
 
     def _scan_directory(self, path: Path, recursive: bool) -> List[Path]:
         """
@@ -238,39 +518,26 @@ class Indexer:
         Raises:
             DirectoryNotFoundError: If directory cannot be accessed
         """
-        markdown_files = []
+        return [Path(entry.path) for entry in self._scan_directory_entries(path, recursive)]
+
+    def _scan_directory_entries(self, path: Path, recursive: bool) -> List[os.DirEntry]:
+        """
+        Scan directory for markdown files, keeping the DirEntry objects.
+
+        Args:
+            path: Directory to scan
+            recursive: Whether to scan subdirectories
+
+        Returns:
+            List of DirEntry objects for markdown files, sorted by path
+
+        Raises:
+            DirectoryNotFoundError: If directory cannot be accessed
+        """
         errors_encountered = []
 
         try:
-            if recursive:
-                # Use rglob for recursive scanning
-                for ext in self.markdown_extensions:
-                    pattern = f"**/*{ext}"
-                    try:
-                        markdown_files.extend(path.rglob(pattern))
-                    except PermissionError as e:
-                        error_msg = f"Permission denied accessing files with pattern {pattern}: {e}"
-                        errors_encountered.append(error_msg)
-                        logger.warning(error_msg)
-                    except OSError as e:
-                        error_msg = f"OS error scanning for pattern {pattern}: {e}"
-                        errors_encountered.append(error_msg)
-                        logger.warning(error_msg)
-            else:
-                # Use glob for non-recursive scanning
-                for ext in self.markdown_extensions:
-                    pattern = f"*{ext}"
-                    try:
-                        markdown_files.extend(path.glob(pattern))
-                    except PermissionError as e:
-                        error_msg = f"Permission denied accessing files with pattern {pattern}: {e}"
-                        errors_encountered.append(error_msg)
-                        logger.warning(error_msg)
-                    except OSError as e:
-                        error_msg = f"OS error scanning for pattern {pattern}: {e}"
-                        errors_encountered.append(error_msg)
-                        logger.warning(error_msg)
-
+            markdown_entries = list(self._scandir_markdown(path, recursive, errors_encountered))
         except PermissionError as e:
             raise DirectoryNotFoundError(f"Permission denied accessing directory {path}: {e}", file_path=path) from e
         except OSError as e:
@@ -278,29 +545,73 @@ class Indexer:
         except Exception as e:
             raise DirectoryNotFoundError(f"Unexpected error scanning directory {path}: {e}", file_path=path) from e
 
-        # Filter out non-files with error handling
-        valid_files = []
-        for file_path in markdown_files:
-            try:
-                if file_path.is_file():
-                    valid_files.append(file_path)
-            except (OSError, PermissionError) as e:
-                logger.warning(f"Cannot access file {file_path}: {e}")
-                continue
-
-        valid_files.sort()
+        # Sort by path components to keep the order of the sorted Path list,
+        # without building a Path for every entry
+        markdown_entries.sort(key=lambda entry: os.path.normcase(entry.path).split(os.sep))
 
         if errors_encountered:
             logger.info(f"Directory scan completed with {len(errors_encountered)} access errors")
 
-        return valid_files
+        return markdown_entries
 
-    def _should_index_file(self, file_path: Path) -> bool:
+    def _scandir_markdown(self, root: Path, recursive: bool, errors: List[str]) -> Iterator[os.DirEntry]:
+        """
+        Walk a directory tree with os.scandir and yield markdown file entries.
+
+        File type checks use the information cached on each DirEntry, so most
+        entries cost no extra stat() call. Symlinked directories are not
+        descended into, which also guards against symlink cycles.
+
+        Args:
+            root: Directory to walk
+            recursive: Whether to descend into subdirectories
+            errors: List that collects messages for inaccessible subdirectories
+
+        Yields:
+            DirEntry objects for markdown files
+
+        Raises:
+            OSError: If the root directory itself cannot be read
+        """
+        extensions = self.markdown_extensions
+        ext_tuple = self._ext_tuple
+        root_path = os.fspath(root)
+        stack = [root_path]
+
+        while stack:
+            directory = stack.pop()
+            try:
+                iterator = os.scandir(directory)
+            except OSError as e:
+                if directory == root_path:
+                    raise
+                error_msg = f"Cannot scan directory {directory}: {e}"
+                errors.append(error_msg)
+                logger.warning(error_msg)
+                continue
+
+            with iterator:
+                for entry in iterator:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            if recursive:
+                                stack.append(entry.path)
+                            continue
+
+                        # A bare ".md" has no suffix, just as with Path.suffix
+                        name = entry.name.lower()
+                        if name.endswith(ext_tuple) and name not in extensions and entry.is_file():
+                            yield entry
+                    except OSError as e:
+                        logger.warning(f"Cannot access file {entry.path}: {e}")
+
+    def _should_index_file(self, file_path: Path, file_stat: Optional[os.stat_result] = None) -> bool:
         """
         Check if a file should be indexed based on modification time and content hash.
 
         Args:
             file_path: Path to check
+            file_stat: Optional stat result already fetched for the file
 
         Returns:
             True if file should be indexed, False if it's up to date
@@ -308,62 +619,164 @@ class Indexer:
         try:
             with self.db_manager.get_connection() as conn:
                 cursor = conn.execute(
-                    "SELECT modified_date, content_hash FROM files WHERE path = ?",
+                    "SELECT modified_date, file_size, content_hash FROM files WHERE path = ?",
                     (str(file_path),)
                 )
                 result = cursor.fetchone()
+        except Exception as e:
+            logger.warning(f"Error checking file status {file_path}: {e}")
+            # If we can't determine status, err on the side of indexing
+            return True
 
-                if not result:
-                    # File not in database, should index
-                    return True
+        # Compare outside the connection block: errors raised inside it
+        # would roll back an open batch transaction
+        return self._file_needs_indexing(file_path, result, file_stat)
 
-                # Check modification time
-                db_modified = datetime.fromisoformat(result['modified_date'])
-                file_modified = datetime.fromtimestamp(file_path.stat().st_mtime)
+    def _get_index_manifest(self, directory: Path) -> Dict[str, Any]:
+        """
+        Fetch the stored change-detection fields for every file under a directory.
 
-                if file_modified > db_modified:
-                    # File has been modified, should index
-                    return True
+        One query replaces a lookup per file when checking a whole directory.
 
-                # Check content hash as additional verification
-                current_hash = self._calculate_content_hash(file_path)
-                if current_hash != result['content_hash']:
-                    # Content has changed, should index
-                    return True
+        Args:
+            directory: Directory whose indexed files to fetch
 
-                # File is up to date
-                return False
+        Returns:
+            Dictionary mapping file path strings to rows with modified_date,
+            file_size and content_hash
+        """
+        try:
+            with self.db_manager.get_connection() as conn:
+                cursor = conn.execute(
+                    "SELECT path, modified_date, file_size, content_hash FROM files "
+                    "WHERE directory = ? OR directory LIKE ?",
+                    (str(directory), f"{directory}%")
+                )
+                return {row['path']: row for row in cursor.fetchall()}
+        except Exception as e:
+            logger.warning(f"Error loading index manifest for {directory}: {e}")
+            return {}
+
+    def _file_needs_indexing(self, file_path: Path, indexed: Optional[Any],
+                             file_stat: Optional[os.stat_result] = None) -> bool:
+        """
+        Compare a file on disk with its stored index row.
+
+        Args:
+            file_path: Path to check
+            indexed: Row with modified_date, file_size and content_hash, or
+                None if the file is not indexed
+            file_stat: Optional stat result already fetched for the file
+
+        Returns:
+            True if file should be indexed, False if it's up to date
+        """
+        return self._check_file_status(file_path, indexed, file_stat)[0]
+
+    def _check_file_status(self, file_path: Path, indexed: Optional[Any],
+                           file_stat: Optional[os.stat_result] = None) -> Tuple[bool, bool]:
+        """
+        Compare a file on disk with its stored index row, without writing.
+
+        Args:
+            file_path: Path to check
+            indexed: Row with modified_date, file_size and content_hash, or
+                None if the file is not indexed
+            file_stat: Optional stat result already fetched for the file
+
+        Returns:
+            Tuple of (needs indexing, stored dates are stale). The second flag
+            is only set for files that were touched but not edited; callers
+            that write to the index pass those to _refresh_file_dates.
+        """
+        try:
+            if not indexed:
+                # File not in database, should index
+                return True, False
+
+            if file_stat is None:
+                file_stat = os.stat(file_path)
+
+            if file_stat.st_size != indexed['file_size']:
+                # A different size means different content
+                return True, False
+
+            # Check modification time
+            db_modified = datetime.fromisoformat(indexed['modified_date'])
+            file_modified = datetime.fromtimestamp(file_stat.st_mtime)
+
+            if file_modified == db_modified:
+                # Same modification time and size as when indexed, so skip
+                # reading and hashing the file
+                return False, False
+
+            # The modification time moved (or went backwards) without the size
+            # changing, so let the content hash decide
+            current_hash = self._calculate_content_hash(file_path)
+            if current_hash != indexed['content_hash']:
+                # Content has changed, should index
+                return True, False
+
+            # Touched but not edited: only the stored timestamps are stale
+            return False, True
 
         except Exception as e:
             logger.warning(f"Error checking file status {file_path}: {e}")
             # If we can't determine status, err on the side of indexing
-            return True
+            return True, False
+
+    def _refresh_file_dates(self, file_path: Path, file_stat: os.stat_result) -> None:
+        """
+        Update the stored timestamps of a file whose content is unchanged.
+
+        Args:
+            file_path: Path of the indexed file
+            file_stat: Current stat result for the file
+        """
+        created_date = datetime.fromtimestamp(file_stat.st_ctime) if hasattr(file_stat, 'st_birthtime') else None
+
+        with self._write_connection() as conn:
+            conn.execute(
+                "UPDATE files SET modified_date = ?, created_date = ? WHERE path = ?",
+                (
+                    datetime.fromtimestamp(file_stat.st_mtime).isoformat(),
+                    created_date.isoformat() if created_date else None,
+                    str(file_path)
+                )
+            )
 
-    def _extract_file_metadata(self, file_path: Path) -> FileMetadata:
+    def _extract_file_metadata(self, file_path: Path, file_stat: Optional[os.stat_result] = None,
+                               content_hash: Optional[str] = None) -> FileMetadata:
         """
         Extract file system metadata.
 
         Args:
             file_path: Path to extract metadata from
+            file_stat: Optional stat result already fetched for the file
+            content_hash: Optional content hash already computed for the file
 
         Returns:
             FileMetadata object
         """
-        stat = file_path.stat()
+        if file_stat is None:
+            file_stat = os.stat(file_path)
+
+        # Split the string form rather than deriving name and parent Paths
+        directory, filename = os.path.split(str(file_path))
 
         return FileMetadata(
             path=file_path,
-            filename=file_path.name,
-            directory=str(file_path.parent),
-            modified_date=datetime.fromtimestamp(stat.st_mtime),
-            created_date=datetime.fromtimestamp(stat.st_ctime) if hasattr(stat, 'st_birthtime') else None,
-            file_size=stat.st_size,
-            content_hash=self._calculate_content_hash(file_path)
+            filename=filename,
+            directory=directory or '.',
+            modified_date=datetime.fromtimestamp(file_stat.st_mtime),
+            created_date=datetime.fromtimestamp(file_stat.st_ctime) if hasattr(file_stat, 'st_birthtime') else None,
+            file_size=file_stat.st_size,
+            content_hash=content_hash or self._calculate_content_hash(file_path)
         )
 
     def _calculate_content_hash(self, file_path: Path) -> str:
         """
-        Calculate SHA-256 hash of file content.
+        Calculate the content hash of a file (SHA-256, or XXH3-128 with fast_hash).
 
         Args:
             file_path: Path to file
@@ -371,14 +784,32 @@ class Indexer:
         Returns:
             Hexadecimal hash string
         """
-        hasher = hashlib.sha256()
+        hasher = self.hash_factory()
 
         try:
-            with open(file_path, 'rb') as f:
-                # Read in chunks to handle large files
-                for chunk in iter(lambda: f.read(8192), b""):
-                    hasher.update(chunk)
+            with open(file_path, 'rb', buffering=0) as f:
+                file_size = os.fstat(f.fileno()).st_size
+                mapped = self._map_large_file(f, file_size)
+                if mapped is not None:
+                    # Hash large files straight from the page cache
+                    with mapped:
+                        hasher.update(mapped)
+                elif hasattr(hashlib, 'file_digest'):
+                    # Python 3.11+: the whole loop runs in C
+                    hasher = hashlib.file_digest(f, self.hash_factory)
+                else:
+                    # Stream through one reusable buffer of at most 1 MiB,
+                    # sized down for small files
+                    buffer_size = min(file_size + 1, 1024 * 1024)
+                    buffer = bytearray(buffer_size)
+                    view = memoryview(buffer)
+                    while True:
+                        size = f.readinto(buffer)
+                        if not size:
+                            break
+                        hasher.update(view[:size])
         except Exception as e:
+            hasher = self.hash_factory()
             logger.error(f"Error calculating hash for {file_path}: {e}")
             # Return a hash of the file path as fallback
             hasher.update(str(file_path).encode('utf-8'))
@@ -427,33 +858,102 @@ class Indexer:
             FileAccessError: If file cannot be accessed
             FileCorruptedError: If file cannot be decoded
         """
-        # Check file size (warn if > 10MB)
+        # Read the bytes once and try each encoding in memory
         try:
-            file_size = file_path.stat().st_size
-            if file_size > 10 * 1024 * 1024:  # 10MB
-                logger.warning(f"Large file detected: {file_path} ({file_size / 1024 / 1024:.1f}MB)")
+            raw = self._read_file_bytes(file_path)
         except OSError as e:
-            raise FileAccessError(f"Cannot access file stats: {e}", file_path=file_path) from e
+            raise FileAccessError(f"Cannot read file: {e}", file_path=file_path) from e
+
+        return self._decode_content(raw, file_path)
+
+    def _read_file_bytes(self, file_path: Path, file_size: int = 0) -> bytes:
+        """
+        Read the raw bytes of a file in a single read.
+
+        Files of 1 MiB or more are memory-mapped instead of copied, so the
+        hasher and decoder read them straight from the page cache. The
+        caller closes the returned mmap.
+
+        Args:
+            file_path: Path to file
+            file_size: Size of the file from an earlier stat, if known
+
+        Returns:
+            File content as bytes, or a read-only mmap for large files
+
+        Raises:
+            OSError: If the file cannot be read
+        """
+        with open(file_path, 'rb') as f:
+            mapped = self._map_large_file(f, file_size)
+            if mapped is not None:
+                return mapped
+            return f.read()
+
+    def _map_large_file(self, f, file_size: int) -> Optional[mmap.mmap]:
+        """
+        Memory-map an open file read-only if it is 1 MiB or larger.
+
+        Args:
+            f: File object opened in binary mode
+            file_size: Size of the file
+
+        Returns:
+            Read-only mmap of the whole file, or None if the file is small or
+            cannot be mapped
+        """
+        if file_size < 1024 * 1024:
+            return None
+
+        try:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (ValueError, OSError) as e:
+            # Emptied since the stat, or on a filesystem without mmap support
+            logger.debug(f"Cannot memory-map {getattr(f, 'name', f)}: {e}")
+            return None
+
+        # Start reading the whole file in now, so the hasher does not fault
+        # its pages in one readahead window at a time (Unix, Python 3.8+)
+        if hasattr(mmap, 'MADV_WILLNEED'):
+            try:
+                mapped.madvise(mmap.MADV_WILLNEED)
+            except OSError:
+                pass
+
+        return mapped
+
+    def _decode_content(self, raw: bytes, file_path: Path) -> str:
+        """
+        Decode file bytes, trying UTF-8 first and falling back to latin-1.
+
+        Args:
+            raw: File content as bytes
+            file_path: Path the bytes were read from, for error reporting
+
+        Returns:
+            File content as string, with newlines normalized like text-mode reads
+
+        Raises:
+            FileCorruptedError: If the bytes cannot be decoded
+        """
+        if len(raw) > 10 * 1024 * 1024:  # 10MB
+            logger.warning(f"Large file detected: {file_path} ({len(raw) / 1024 / 1024:.1f}MB)")
 
-        # Try UTF-8 first, then fall back to latin-1
         encodings = ['utf-8', 'utf-8-sig', 'latin-1']
         last_error = None
 
         for encoding in encodings:
             try:
-                with open(file_path, 'r', encoding=encoding) as f:
-                    content = f.read()
-                logger.debug(f"Successfully read {file_path} with {encoding} encoding")
-                return content
+                content = str(raw, encoding)
             except UnicodeDecodeError as e:
                 last_error = e
                 continue
-            except (OSError, PermissionError) as e:
-                raise FileAccessError(f"Cannot read file: {e}", file_path=file_path) from e
-            except Exception as e:
-                raise FileAccessError(f"Unexpected error reading file: {e}", file_path=file_path) from e
 
-        # If we get here, all encodings failed
+            # Text-mode reads translate \r\n and \r line endings
+            if '\r' in content:
+                content = content.replace('\r\n', '\n').replace('\r', '\n')
+            return content
+
         raise FileCorruptedError(
             f"Cannot decode file with any supported encoding (tried: {', '.join(encodings)}): {last_error}",
             file_path=file_path
@@ -470,11 +970,8 @@ class Indexer:
         Returns:
             ParsedContent object with all parsed data including Obsidian features
         """
-        # Parse frontmatter first
-        frontmatter = self.frontmatter_parser.parse(content)
-
-        # Get content without frontmatter
-        content_without_fm = self.frontmatter_parser.get_content_without_frontmatter(content)
+        # Parse frontmatter and get content without it from a single scan
+        frontmatter, content_without_fm = self.frontmatter_parser.parse_with_content(content)
 
         # Sanitize content for parsing (handle templates, etc.)
         sanitized_content = self.obsidian_parser.sanitize_content_for_parsing(content_without_fm)
@@ -482,17 +979,24 @@ class Indexer:
         # Parse markdown content
         parsed_md = self.markdown_parser.parse(sanitized_content)
 
-        # Extract tags from both frontmatter and content (enhanced for Obsidian)
-        all_tags = self.tag_parser.parse_all_tags(frontmatter, content_without_fm)
-        obsidian_tags = self.obsidian_parser.parse_obsidian_tags(content_without_fm)
-
-        # Extract links (both standard and Obsidian)
-        standard_links = self.link_parser.parse(content_without_fm)
-        enhanced_links = self.obsidian_parser.extract_enhanced_links(content_without_fm)
+        # Extract tags from both frontmatter and content (enhanced for Obsidian).
+        # The Obsidian tag pattern captures exactly what the hashtag pattern does,
+        # so the content is scanned once and the matches normalized both ways.
+        tag_matches = self.tag_parser.hashtag_pattern.findall(content_without_fm)
+        all_tags = {
+            'frontmatter': self.tag_parser.parse_frontmatter_tags(frontmatter),
+            'content': self.tag_parser.normalize_inline_tags(tag_matches)
+        }
+        obsidian_tags = self.obsidian_parser.normalize_obsidian_tags(tag_matches)
 
         # Parse Obsidian-specific features
         obsidian_features = self.obsidian_parser.parse_obsidian_features(content_without_fm, file_path)
 
+        # Extract links (both standard and Obsidian), reusing the wikilinks
+        # parsed above rather than rescanning the content for them
+        standard_links = self.link_parser.parse(content_without_fm)
+        enhanced_links = standard_links + obsidian_features['wikilinks']
+
         # Get title from frontmatter or first heading
         title = None
         if frontmatter:
@@ -525,9 +1029,92 @@ class Indexer:
             headings=[h.text for h in parsed_md.headings],
             tags=list(set(all_tag_list)),  # Remove duplicates
             links=all_links,
-            obsidian_features=obsidian_features
+            obsidian_features=obsidian_features,
+            word_count=self.markdown_parser.count_words(parsed_md.sanitized_content)
         )
 
+    @contextmanager
+    def _batched_writes(self):
+        """
+        Write all files stored inside the block in a single transaction.
+
+        Without batching every stored file commits (and syncs the journal) on
+        its own. Nested batches on the same thread join the outermost one. If
+        an exception escapes the block nothing in it is committed.
+
+        Yields:
+            sqlite3.Connection: Connection holding the open transaction
+        """
+        batch_connection = getattr(self._batch_state, 'connection', None)
+        if batch_connection is not None:
+            yield batch_connection
+            return
+
+        with self.db_manager.get_connection() as conn:
+            self._begin_immediate(conn)
+            self._batch_state.connection = conn
+            try:
+                yield conn
+            except BaseException:
+                conn.rollback()
+                raise
+            else:
+                conn.commit()
+            finally:
+                self._batch_state.connection = None
+
+    @contextmanager
+    def _write_connection(self):
+        """
+        Provide a connection for writing one file's rows.
+
+        Inside _batched_writes the rows join the open transaction under a
+        savepoint, so a failing file is rolled back without losing the rest of
+        the batch. Otherwise the file's rows are written in a transaction of
+        their own, begun IMMEDIATE so the write lock is taken before any row
+        is written instead of being upgraded partway through, and rolled back
+        if writing them fails.
+
+        Yields:
+            sqlite3.Connection: Connection to write with
+        """
+        conn = getattr(self._batch_state, 'connection', None)
+        if conn is not None:
+            conn.execute("SAVEPOINT store_file")
+            try:
+                yield conn
+            except Exception:
+                conn.execute("ROLLBACK TO store_file")
+                raise
+            finally:
+                conn.execute("RELEASE store_file")
+            return
+
+        with self.db_manager.get_connection() as conn:
+            self._begin_immediate(conn)
+            try:
+                yield conn
+            except BaseException:
+                conn.rollback()
+                raise
+            conn.commit()
+
+    def _begin_immediate(self, conn) -> None:
+        """
+        Start a write transaction on a connection, taking the write lock now.
+
+        Outside a batch a per-thread connection should never be mid
+        transaction; one left open by an earlier failure holds that failure's
+        partial rows, so it is rolled back rather than joined.
+
+        Args:
+            conn: Connection to begin the transaction on
+        """
+        if conn.in_transaction:
+            logger.warning("Rolling back a transaction left open on this thread's connection")
+            conn.rollback()
+        conn.execute("BEGIN IMMEDIATE")
+
     def _store_file_data(self, file_metadata: FileMetadata, parsed_content: ParsedContent) -> None:
         """
         Store file data and parsed content in database.
@@ -536,11 +1123,21 @@ class Indexer:
             file_metadata: File metadata
             parsed_content: Parsed content data
         """
-        with self.db_manager.get_connection() as conn:
-            # Update file metadata (including word count and heading count)
-            file_metadata.word_count = len(parsed_content.content.split()) if parsed_content.content else 0
+        with self._write_connection() as conn:
+            # Update file metadata (including word count and heading count).
+            # The word count is normally computed while parsing, which runs in
+            # the worker processes when indexing in parallel
+            word_count = parsed_content.word_count
+            if word_count is None:
+                word_count = self.markdown_parser.count_words(parsed_content.content or '')
+            file_metadata.word_count = word_count
             file_metadata.heading_count = len(parsed_content.headings)
 
+            # Look up the id of an earlier version of this file, whose row the
+            # replace below deletes; its full-text row must go with it
+            cursor = conn.execute("SELECT id FROM files WHERE path = ?", (str(file_metadata.path),))
+            previous = cursor.fetchone()
+
             # Insert or replace file record
             cursor = conn.execute("""
                 INSERT OR REPLACE INTO files
@@ -573,12 +1170,15 @@ class Indexer:
             conn.execute("DELETE FROM frontmatter WHERE file_id = ?", (file_id,))
             conn.execute("DELETE FROM tags WHERE file_id = ?", (file_id,))
             conn.execute("DELETE FROM links WHERE file_id = ?", (file_id,))
-            conn.execute("DELETE FROM content_fts WHERE file_id = ?", (file_id,))
+            conn.execute("DELETE FROM content_fts WHERE rowid = ?", (file_id,))
+            if previous and previous['id'] != file_id:
+                conn.execute("DELETE FROM content_fts WHERE rowid = ?", (previous['id'],))
 
             # Clear Obsidian-specific data
             self._clear_obsidian_data(conn, file_id)
 
             # Insert frontmatter data
+            frontmatter_rows = []
             for key, value_data in parsed_content.frontmatter.items():
                 if isinstance(value_data, dict) and 'value' in value_data:
                     value = str(value_data['value']) if value_data['value'] is not None else None
@@ -590,17 +1190,16 @@ class Indexer:
                     value_type = 'string'
 
                 # Only insert if value_type is valid according to database constraint
-                if value_type in ('string', 'number', 'boolean', 'array', 'date'):
-                    conn.execute("""
-                        INSERT INTO frontmatter (file_id, key, value, value_type)
-                        VALUES (?, ?, ?, ?)
-                    """, (file_id, key, value, value_type))
-                else:
+                if value_type not in ('string', 'number', 'boolean', 'array', 'date'):
                     # Fallback to string for invalid types
-                    conn.execute("""
-                        INSERT INTO frontmatter (file_id, key, value, value_type)
-                        VALUES (?, ?, ?, ?)
-                    """, (file_id, key, value, 'string'))
+                    value_type = 'string'
+
+                frontmatter_rows.append((file_id, key, value, value_type))
+
+            conn.executemany("""
+                INSERT INTO frontmatter (file_id, key, value, value_type)
+                VALUES (?, ?, ?, ?)
+            """, frontmatter_rows)
 
             # Insert tags
             # Re-parse to get source information, but also include any tags from parsed_content
@@ -608,45 +1207,44 @@ class Indexer:
 
             # Keep track of inserted tags to avoid duplicates
             inserted_tags = set()
+            tag_rows = []
 
             for tag in tag_sources.get('frontmatter', []):
                 if tag not in inserted_tags:
-                    conn.execute("""
-                        INSERT INTO tags (file_id, tag, source)
-                        VALUES (?, ?, ?)
-                    """, (file_id, tag, 'frontmatter'))
+                    tag_rows.append((file_id, tag, 'frontmatter'))
                     inserted_tags.add(tag)
 
             for tag in tag_sources.get('content', []):
                 if tag not in inserted_tags:
-                    conn.execute("""
-                        INSERT INTO tags (file_id, tag, source)
-                        VALUES (?, ?, ?)
-                    """, (file_id, tag, 'content'))
+                    tag_rows.append((file_id, tag, 'content'))
                     inserted_tags.add(tag)
 
             # Also insert any tags that were directly provided in parsed_content.tags
             # but not found by the parser (in case they were manually added)
             for tag in parsed_content.tags:
                 if tag not in inserted_tags:
-                    conn.execute("""
-                        INSERT INTO tags (file_id, tag, source)
-                        VALUES (?, ?, ?)
-                    """, (file_id, tag, 'unknown'))
+                    tag_rows.append((file_id, tag, 'unknown'))
                     inserted_tags.add(tag)
 
+            conn.executemany("""
+                INSERT INTO tags (file_id, tag, source)
+                VALUES (?, ?, ?)
+            """, tag_rows)
+
             # Insert links
-            for link in parsed_content.links:
-                conn.execute("""
-                    INSERT INTO links (file_id, link_text, link_target, link_type, is_internal)
-                    VALUES (?, ?, ?, ?, ?)
-                """, (
+            conn.executemany("""
+                INSERT INTO links (file_id, link_text, link_target, link_type, is_internal)
+                VALUES (?, ?, ?, ?, ?)
+            """, [
+                (
                     file_id,
                     link.get('link_text'),
                     link['link_target'],
                     link['link_type'],
                     link['is_internal']
-                ))
+                )
+                for link in parsed_content.links
+            ])
 
             # Insert Obsidian-specific data
             self._store_obsidian_data(conn, file_id, parsed_content.obsidian_features)
@@ -654,17 +1252,16 @@ class Indexer:
             # Insert FTS5 content
             headings_text = ' '.join(parsed_content.headings) if parsed_content.headings else ''
             conn.execute("""
-                INSERT INTO content_fts (file_id, title, content, headings)
-                VALUES (?, ?, ?, ?)
+                INSERT INTO content_fts (rowid, file_id, title, content, headings)
+                VALUES (?, ?, ?, ?, ?)
             """, (
+                file_id,
                 file_id,
                 parsed_content.title or '',
                 parsed_content.content or '',
                 headings_text
             ))
 
-            conn.commit()
-
     def _map_frontmatter_type(self, parser_type: str) -> str:
         """
         Map frontmatter parser types to database constraint types.
@@ -760,24 +1357,34 @@ class Indexer:
             logger.info(f"Cleanup completed: {cleanup_stats}")
 
         # Scan for markdown files
-        markdown_files = self._scan_directory(path, recursive)
-        logger.info(f"Found {len(markdown_files)} markdown files to process")
+        markdown_entries = self._scan_directory_entries(path, recursive)
+        logger.info(f"Found {len(markdown_entries)} markdown files to process")
+        manifest = self._get_index_manifest(path)
 
         # Process each file, but only if it needs updating
-        for file_path in markdown_files:
-            try:
-                if self._should_index_file(file_path):
-                    self.index_file(file_path)
-                    self.stats['files_updated'] += 1
-                else:
-                    self.stats['files_skipped'] += 1
-                    logger.debug(f"Skipped file (no changes): {file_path}")
+        with self._batched_writes():
+            for entry in markdown_entries:
+                file_path = Path(entry.path)
+                try:
+                    # One cached stat() serves both the check and the indexing
+                    file_stat = entry.stat()
+                    needs_indexing, dates_stale = self._check_file_status(
+                        file_path, manifest.get(str(file_path)), file_stat
+                    )
+                    if needs_indexing:
+                        self.index_file(file_path, file_stat)
+                        self.stats['files_updated'] += 1
+                    else:
+                        if dates_stale:
+                            self._refresh_file_dates(file_path, file_stat)
+                        self.stats['files_skipped'] += 1
+                        logger.debug(f"Skipped file (no changes): {file_path}")
 
-                self.stats['files_processed'] += 1
+                    self.stats['files_processed'] += 1
 
-            except Exception as e:
-                self.stats['errors'] += 1
-                logger.error(f"Error indexing file {file_path}: {e}")
+                except Exception as e:
+                    self.stats['errors'] += 1
+                    logger.error(f"Error indexing file {file_path}: {e}")
 
         # Update cache timestamp if cache manager is available
         if self.cache_manager:
@@ -809,7 +1416,7 @@ class Indexer:
                     if result:
                         file_id = result['id']
                         conn.execute("DELETE FROM files WHERE id = ?", (file_id,))
-                        conn.execute("DELETE FROM content_fts WHERE file_id = ?", (file_id,))
+                        conn.execute("DELETE FROM content_fts WHERE rowid = ?", (file_id,))
                         conn.commit()
                         logger.debug(f"Removed file from index: {file_path}")
                         return True
@@ -878,8 +1485,12 @@ class Indexer:
             # Get currently indexed files in this directory
             indexed_files = set(self.get_indexed_files_in_directory(directory))
 
-            # Get current files on disk
-            current_files = set(self._scan_directory(directory, recursive))
+            # Get current files on disk, keeping their entries for the cached stat
+            current_entries = {
+                Path(entry.path): entry
+                for entry in self._scan_directory_entries(directory, recursive)
+            }
+            current_files = set(current_entries)
 
             # Files to remove (in index but not on disk)
             files_to_remove = indexed_files - current_files
@@ -889,25 +1500,33 @@ class Indexer:
                     logger.debug(f"Removed deleted file from index: {file_path}")
 
             # Files to check for updates (on disk)
-            for file_path in current_files:
-                try:
-                    if file_path in indexed_files:
-                        # File exists in index, check if it needs updating
-                        if self._should_index_file(file_path):
-                            self.index_file(file_path)
-                            sync_stats['files_updated'] += 1
-                            logger.debug(f"Updated modified file: {file_path}")
+            manifest = self._get_index_manifest(directory)
+            with self._batched_writes():
+                for file_path, entry in current_entries.items():
+                    try:
+                        file_stat = entry.stat()
+                        if file_path in indexed_files:
+                            # File exists in index, check if it needs updating
+                            needs_indexing, dates_stale = self._check_file_status(
+                                file_path, manifest.get(str(file_path)), file_stat
+                            )
+                            if needs_indexing:
+                                self.index_file(file_path, file_stat)
+                                sync_stats['files_updated'] += 1
+                                logger.debug(f"Updated modified file: {file_path}")
+                            else:
+                                if dates_stale:
+                                    self._refresh_file_dates(file_path, file_stat)
+                                sync_stats['files_unchanged'] += 1
                         else:
-                            sync_stats['files_unchanged'] += 1
-                    else:
-                        # New file, add to index
-                        self.index_file(file_path)
-                        sync_stats['files_added'] += 1
-                        logger.debug(f"Added new file to index: {file_path}")
+                            # New file, add to index
+                            self.index_file(file_path, file_stat)
+                            sync_stats['files_added'] += 1
+                            logger.debug(f"Added new file to index: {file_path}")
 
-                except Exception as e:
-                    sync_stats['errors'] += 1
-                    logger.error(f"Error syncing file {file_path}: {e}")
+                    except Exception as e:
+                        sync_stats['errors'] += 1
+                        logger.error(f"Error syncing file {file_path}: {e}")
 
             # Update cache timestamp if cache manager is available
             if self.cache_manager:
@@ -947,13 +1566,12 @@ class Indexer:
 
         try:
             # Store wikilinks
-            wikilinks = obsidian_features.get('wikilinks', [])
-            for link in wikilinks:
-                conn.execute("""
-                    INSERT INTO obsidian_links
-                    (file_id, link_text, link_target, obsidian_type, section, block_id, has_alias)
-                    VALUES (?, ?, ?, ?, ?, ?, ?)
-                """, (
+            conn.executemany("""
+                INSERT INTO obsidian_links
+                (file_id, link_text, link_target, obsidian_type, section, block_id, has_alias)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+            """, [
+                (
                     file_id,
                     link.get('link_text'),
                     link.get('link_target'),
@@ -961,112 +1579,106 @@ class Indexer:
                     link.get('section'),
                     link.get('block_id'),
                     link.get('has_alias', False)
-                ))
+                )
+                for link in obsidian_features.get('wikilinks', [])
+            ])
 
             # Store embeds
-            embeds = obsidian_features.get('embeds', [])
-            for embed in embeds:
-                conn.execute("""
-                    INSERT INTO obsidian_embeds
-                    (file_id, embed_target, embed_alias, embed_type)
-                    VALUES (?, ?, ?, ?)
-                """, (
+            conn.executemany("""
+                INSERT INTO obsidian_embeds
+                (file_id, embed_target, embed_alias, embed_type)
+                VALUES (?, ?, ?, ?)
+            """, [
+                (
                     file_id,
                     embed.get('embed_target'),
                     embed.get('embed_alias'),
                     embed.get('embed_type', 'page')
-                ))
+                )
+                for embed in obsidian_features.get('embeds', [])
+            ])
 
             # Store templates
-            templates = obsidian_features.get('templates', [])
-            for template in templates:
-                conn.execute("""
-                    INSERT INTO obsidian_templates
-                    (file_id, template_name, template_arg, start_pos, end_pos)
-                    VALUES (?, ?, ?, ?, ?)
-                """, (
+            conn.executemany("""
+                INSERT INTO obsidian_templates
+                (file_id, template_name, template_arg, start_pos, end_pos)
+                VALUES (?, ?, ?, ?, ?)
+            """, [
+                (
                     file_id,
                     template.get('template_name'),
                     template.get('template_arg'),
                     template.get('start_pos', 0),
                     template.get('end_pos', 0)
-                ))
+                )
+                for template in obsidian_features.get('templates', [])
+            ])
 
             # Store callouts
-            callouts = obsidian_features.get('callouts', [])
-            for callout in callouts:
-                conn.execute("""
-                    INSERT INTO obsidian_callouts
-                    (file_id, callout_type, callout_title, line_number)
-                    VALUES (?, ?, ?, ?)
-                """, (
+            conn.executemany("""
+                INSERT INTO obsidian_callouts
+                (file_id, callout_type, callout_title, line_number)
+                VALUES (?, ?, ?, ?)
+            """, [
+                (
                     file_id,
                     callout.get('callout_type'),
                     callout.get('callout_title'),
                     callout.get('line_number', 0)
-                ))
+                )
+                for callout in obsidian_features.get('callouts', [])
+            ])
 
             # Store block references
-            block_refs = obsidian_features.get('block_references', [])
-            for block_ref in block_refs:
-                conn.execute("""
-                    INSERT INTO obsidian_blocks
-                    (file_id, block_id, line_number)
-                    VALUES (?, ?, ?)
-                """, (
+            conn.executemany("""
+                INSERT INTO obsidian_blocks
+                (file_id, block_id, line_number)
+                VALUES (?, ?, ?)
+            """, [
+                (
                     file_id,
                     block_ref.get('block_id'),
                     block_ref.get('line_number', 0)
-                ))
+                )
+                for block_ref in obsidian_features.get('block_references', [])
+            ])
 
             # Store dataview queries
-            dataview_queries = obsidian_features.get('dataview_queries', [])
-            for query in dataview_queries:
-                conn.execute("""
-                    INSERT INTO obsidian_dataview
-                    (file_id, query_content, line_number, start_pos, end_pos)
-                    VALUES (?, ?, ?, ?, ?)
-                """, (
+            conn.executemany("""
+                INSERT INTO obsidian_dataview
+                (file_id, query_content, line_number, start_pos, end_pos)
+                VALUES (?, ?, ?, ?, ?)
+            """, [
+                (
                     file_id,
                     query.get('query_content'),
                     query.get('line_number', 0),
                     query.get('start_pos', 0),
                     query.get('end_pos', 0)
-                ))
+                )
+                for query in obsidian_features.get('dataview_queries', [])
+            ])
 
             # Store graph connections
             graph_connections = obsidian_features.get('graph_connections', {})
             if isinstance(graph_connections, dict):
-                outgoing_links = graph_connections.get('outgoing_links', [])
                 connection_strength = graph_connections.get('connection_strength', {})
 
-                for target in outgoing_links:
-                    strength = connection_strength.get(target, 1)
-                    conn.execute("""
-                        INSERT INTO obsidian_graph
-                        (source_file_id, target_name, connection_type, connection_strength)
-                        VALUES (?, ?, ?, ?)
-                    """, (
-                        file_id,
-                        target,
-                        'wikilink',
-                        strength
-                    ))
-
-                # Store embeds as stronger connections
-                embeds_list = graph_connections.get('embeds', [])
-                for target in embeds_list:
-                    strength = connection_strength.get(target, 2)
-                    conn.execute("""
-                        INSERT INTO obsidian_graph
-                        (source_file_id, target_name, connection_type, connection_strength)
-                        VALUES (?, ?, ?, ?)
-                    """, (
-                        file_id,
-                        target,
-                        'embed',
-                        strength
-                    ))
+                # Outgoing links, followed by embeds as stronger connections
+                graph_rows = [
+                    (file_id, target, 'wikilink', connection_strength.get(target, 1))
+                    for target in graph_connections.get('outgoing_links', [])
+                ]
+                graph_rows.extend(
+                    (file_id, target, 'embed', connection_strength.get(target, 2))
+                    for target in graph_connections.get('embeds', [])
+                )
+
+                conn.executemany("""
+                    INSERT INTO obsidian_graph
+                    (source_file_id, target_name, connection_type, connection_strength)
+                    VALUES (?, ?, ?, ?)
+                """, graph_rows)
 
         except Exception as e:
             logger.warning(f"Error storing Obsidian data: {e}")
@@ -8,6 +8,7 @@ to AI assistants through the Model Context Protocol.
 import asyncio
 import json
 import logging
+import os
 import traceback
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Union
@@ -91,8 +92,13 @@ class MDQueryMCPServer(ConsistentToolMixin):
         self.concurrent_manager: Optional[ConcurrentRequestManager] = None
         self.response_formatter: Optional[ResponseFormatter] = None
 
-        # Thread pool for blocking operations
-        self.executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="mdquery-mcp")
+        # Thread pool for blocking operations. sqlite3 releases the GIL while
+        # a statement runs, so size the pool like an I/O-bound one (CPU count
+        # plus a few) and cap it below the concurrent manager's reader limit
+        self.executor = ThreadPoolExecutor(
+            max_workers=min(8, (os.cpu_count() or 1) + 4),
+            thread_name_prefix="mdquery-mcp"
+        )
 
         # Thread safety lock
         self._lock = threading.RLock()
@@ -102,6 +108,10 @@ class MDQueryMCPServer(ConsistentToolMixin):
         self._initialization_successful = False
         self._initialization_error: Optional[Exception] = None
 
+        # Seconds to wait before the first initialization retry; doubled
+        # after each further failure
+        self._initialization_retry_delay = 1.0
+
         # Initialize MCP server
         self.server = FastMCP("mdquery")
         self._setup_tools()
@@ -1880,7 +1890,7 @@ class MDQueryMCPServer(ConsistentToolMixin):
         """
         self._initialization_attempted = True
         max_retries = 3
-        retry_delay = 1.0  # seconds
+        retry_delay = self._initialization_retry_delay
 
         for attempt in range(max_retries):
             try:
@@ -45,6 +45,7 @@ class ParsedContent:
     tags: List[str]
     links: List[Dict[str, Union[str, bool]]]
     obsidian_features: Optional[Dict[str, Any]] = None
+    word_count: Optional[int] = None
 
     def __post_init__(self):
         """Ensure all fields have proper default values."""
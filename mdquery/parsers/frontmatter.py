@@ -2,14 +2,39 @@
 Frontmatter parser for extracting YAML/JSON/TOML frontmatter from markdown files.
 """
 
-import json
+import os
 import re
-from datetime import datetime, date
-from typing import Any, Dict, List, Union
+from datetime import datetime, date, timedelta, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
 
-import frontmatter
-import toml
-import yaml
+# yaml, toml, json, python-frontmatter and multiprocessing are imported
+# where they are first needed, so content without frontmatter (and
+# processes that never parse any) skip their import cost.
+
+
+# Parser reused by every task that runs in a parse_many worker process
+_worker_parser = None
+
+
+def _parse_file_frontmatter(path: str) -> Dict[str, Any]:
+    """
+    Worker entry point for FrontmatterParser.parse_many.
+
+    Defined at module level so it can be pickled by multiprocessing.
+
+    Args:
+        path: Path of the markdown file to parse
+
+    Returns:
+        Typed frontmatter dictionary for the file
+    """
+    global _worker_parser
+    if _worker_parser is None:
+        _worker_parser = FrontmatterParser()
+
+    with open(path, 'r', encoding='utf-8', errors='replace') as f:
+        return _worker_parser.parse(f.read())
 
 
 class FrontmatterParser:
@@ -17,13 +42,33 @@ class FrontmatterParser:
 
     def __init__(self):
         """Initialize the frontmatter parser."""
-        # Date patterns for type inference
-        self.date_patterns = [
-            r'^\d{4}-\d{2}-\d{2}$',  # YYYY-MM-DD
-            r'^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}',  # ISO 8601 basic
-            r'^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}\.\d{3}Z?$',  # ISO 8601 with milliseconds
-            r'^\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}',  # YYYY-MM-DD HH:MM:SS
-        ]
+        # Single date pattern for type inference covering YYYY-MM-DD,
+        # YYYY-MM-DD HH:MM:SS and ISO 8601 with optional fraction and timezone
+        self.date_pattern = re.compile(
+            r'(\d{4})-(\d{2})-(\d{2})'
+            r'(?:T(\d{2}):(\d{2}):(\d{2})(?:\.\d+)?(Z|[+-]\d{2}:?\d{2})?'
+            r'| (\d{2}):(\d{2}):(\d{2}))?',
+            re.ASCII
+        )
+
+        # Lowercased strings treated as boolean-like values
+        self.boolean_strings = frozenset(('true', 'false', 'yes', 'no', 'on', 'off'))
+        self.true_strings = frozenset(('true', 'yes', 'on'))
+
+        # Characters an ASCII numeric string can start with
+        self.number_start_chars = frozenset('0123456789+-.')
+
+        # Shared typed values for leaves whose result never varies. Typed
+        # frontmatter is treated as read-only, so every null/true/false leaf
+        # can reference the same dict instead of allocating a new one.
+        self._null_value = {'value': None, 'type': 'null'}
+        self._true_value = {'value': True, 'type': 'boolean'}
+        self._false_value = {'value': False, 'type': 'boolean'}
+
+        # Delimiter lines, matching python-frontmatter's format handlers
+        self.yaml_boundary = re.compile(r'^-{3,}\s*$', re.MULTILINE)
+        self.toml_boundary = re.compile(r'^\+{3,}\s*$', re.MULTILINE)
+        self.json_boundary = re.compile(r'^(?:{|})$', re.MULTILINE)
 
     def parse(self, content: str) -> Dict[str, Any]:
         """
@@ -36,8 +81,29 @@ class FrontmatterParser:
             Dictionary of frontmatter fields with type inference
         """
         try:
-            # Use python-frontmatter to extract frontmatter
-            post = frontmatter.loads(content)
+            text = self._strip_leading(content)
+
+            # Cheap prefix checks decide the format before any regex runs
+            if not text.startswith(('---', '{', '+++')):
+                return {}
+
+            # YAML is typed straight from the node graph in a single pass
+            opening = self.yaml_boundary.match(text) if text.startswith('---') else None
+            if opening:
+                bounds = self._find_block_bounds(text, self.yaml_boundary, opening)
+                if bounds is None:
+                    return {}
+                import yaml
+                try:
+                    return self._parse_yaml_block(text[opening.end():bounds[0]])
+                except yaml.YAMLError:
+                    # Malformed YAML; the manual fallback would only re-parse
+                    # the same block and fail again
+                    return {}
+
+            # Use python-frontmatter to extract JSON/TOML frontmatter
+            import frontmatter
+            post = frontmatter.loads(text)
 
             if not post.metadata:
                 return {}
@@ -53,6 +119,138 @@ class FrontmatterParser:
             # If frontmatter parsing fails, try manual extraction
             return self._manual_parse(content)
 
+    @classmethod
+    def parse_many(cls, paths: Sequence[Union[str, Path]],
+                   workers: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Parse the frontmatter of many files using a process pool.
+
+        Parsing is CPU bound and holds the GIL, so large batches are spread
+        across processes. Callers running this from a script must guard the
+        entry point with ``if __name__ == '__main__':`` on platforms that
+        spawn worker processes.
+
+        Args:
+            paths: Markdown file paths to parse
+            workers: Number of worker processes (defaults to CPU count)
+
+        Returns:
+            Typed frontmatter dictionaries in the same order as paths
+        """
+        path_strs = [str(path) for path in paths]
+        workers = workers or os.cpu_count() or 1
+
+        # Pool start-up costs more than parsing a handful of files
+        if workers == 1 or len(path_strs) < 2:
+            return [_parse_file_frontmatter(path) for path in path_strs]
+
+        import multiprocessing
+
+        chunksize = max(1, min(32, len(path_strs) // (workers * 4)))
+        with multiprocessing.Pool(workers) as pool:
+            return pool.map(_parse_file_frontmatter, path_strs, chunksize=chunksize)
+
+    def _strip_leading(self, content: str) -> str:
+        """
+        Drop a byte order mark and leading whitespace before format detection.
+
+        The common case starts directly with a delimiter or with body text,
+        so the content is only copied when there is something to remove.
+
+        Args:
+            content: Raw markdown file content
+
+        Returns:
+            Content starting at its first non-whitespace character
+        """
+        if content[:1].isspace() or content.startswith('\ufeff'):
+            return content.lstrip('\ufeff').lstrip()
+        return content
+
+    def _find_block_bounds(self, text: str, boundary: re.Pattern,
+                           opening: re.Match) -> Optional[Tuple[int, int]]:
+        """
+        Locate the closing delimiter line of a frontmatter block.
+
+        Args:
+            text: Markdown content starting with a delimiter line
+            boundary: Delimiter line pattern of the frontmatter format
+            opening: Match of the opening delimiter line
+
+        Returns:
+            Tuple of (closing delimiter start, body start), or None if the
+            frontmatter block is never closed
+        """
+        closing = boundary.search(text, opening.end())
+        if closing is None:
+            return None
+        return closing.start(), closing.end()
+
+    def _parse_yaml_block(self, block: str) -> Dict[str, Any]:
+        """
+        Parse a YAML frontmatter block directly into typed values.
+
+        The block is composed into a node graph and typed values are built
+        while walking it, instead of materializing plain Python objects with
+        yaml.safe_load and walking them a second time.
+
+        Args:
+            block: YAML text between the frontmatter delimiters
+
+        Returns:
+            Dictionary of frontmatter fields with type inference
+
+        Raises:
+            yaml.YAMLError: If the block is not valid YAML
+        """
+        import yaml
+
+        # Prefer the libyaml-backed loader when PyYAML was built with it
+        loader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)(block)
+        try:
+            node = loader.get_single_node()
+            if node is None or node.id != 'mapping':
+                # Non-mapping frontmatter carries no fields
+                return {}
+            typed = self._typed_node(loader, node)['value']
+            # Field names are stored as text, so normalize keys such as `1:`
+            return {str(key): value for key, value in typed.items()}
+        finally:
+            loader.dispose()
+
+    def _typed_node(self, loader: Any, node: Any) -> Dict[str, Any]:
+        """
+        Build the typed value for a composed YAML node.
+
+        Args:
+            loader: Loader that composed the node, used to construct scalars
+            node: YAML node to convert
+
+        Returns:
+            Dictionary with 'value', 'type' and type-specific keys
+        """
+        if node.id == 'scalar' and node.tag == 'tag:yaml.org,2002:str':
+            return self._infer_string_type(node.value)
+
+        if node.id == 'sequence' and node.tag == 'tag:yaml.org,2002:seq':
+            typed_items = [self._typed_node(loader, item) for item in node.value]
+            return {
+                'value': [item['value'] for item in typed_items],
+                'type': 'array',
+                'item_types': tuple([item['type'] for item in typed_items])
+            }
+
+        if node.id == 'mapping' and node.tag == 'tag:yaml.org,2002:map':
+            loader.flatten_mapping(node)
+            typed_dict = {}
+            for key_node, value_node in node.value:
+                key = loader.construct_object(key_node, deep=True)
+                typed_dict[key] = self._typed_node(loader, value_node)
+            return {'value': typed_dict, 'type': 'object'}
+
+        # Other scalars (int, float, bool, null, timestamp) and special tags
+        return self._infer_type(loader.construct_object(node, deep=True))
+
     def _infer_type(self, value: Any) -> Dict[str, Any]:
         """
         Infer the type of a frontmatter value and return structured data.
@@ -64,7 +262,7 @@ class FrontmatterParser:
             Dictionary with 'value', 'type', and optionally 'original' keys
         """
         if value is None:
-            return {'value': None, 'type': 'null'}
+            return self._null_value
 
         # Handle lists/arrays
         if isinstance(value, list):
@@ -72,7 +270,7 @@ class FrontmatterParser:
             return {
                 'value': [item['value'] for item in typed_items],
                 'type': 'array',
-                'item_types': [item['type'] for item in typed_items]
+                'item_types': tuple([item['type'] for item in typed_items])
             }
 
         # Handle dictionaries/objects
@@ -84,7 +282,7 @@ class FrontmatterParser:
 
         # Handle booleans (must come before numbers since bool is subclass of int)
         if isinstance(value, bool):
-            return {'value': value, 'type': 'boolean'}
+            return self._true_value if value else self._false_value
 
         # Handle numbers
         if isinstance(value, (int, float)):
@@ -124,41 +322,20 @@ class FrontmatterParser:
         Returns:
             Dictionary with type information
         """
-        # Check for date patterns
-        for pattern in self.date_patterns:
-            if re.match(pattern, value):
-                try:
-                    # Try to parse as datetime
-                    if 'T' in value:
-                        # Handle ISO 8601 formats
-                        clean_value = value.replace('Z', '+00:00')
-                        # Handle milliseconds by removing them for parsing
-                        if '.' in clean_value and clean_value.count('.') == 1:
-                            parts = clean_value.split('.')
-                            if len(parts) == 2 and ('+' in parts[1] or parts[1].isdigit()):
-                                # Remove milliseconds but keep timezone
-                                if '+' in parts[1]:
-                                    clean_value = parts[0] + '+' + parts[1].split('+')[1]
-                                else:
-                                    clean_value = parts[0]
-                        parsed_date = datetime.fromisoformat(clean_value)
-                    elif ' ' in value:
-                        parsed_date = datetime.strptime(value, '%Y-%m-%d %H:%M:%S')
-                    else:
-                        parsed_date = datetime.strptime(value, '%Y-%m-%d')
-
-                    return {
-                        'value': value,
-                        'type': 'date',
-                        'parsed_date': parsed_date.isoformat()
-                    }
-                except ValueError:
-                    pass
-
-        # Check for boolean strings
-        lower_value = value.lower()
-        if lower_value in ('true', 'false', 'yes', 'no', 'on', 'off'):
-            bool_value = lower_value in ('true', 'yes', 'on')
+        # Check for date patterns (the pattern starts with YYYY-MM-DD)
+        if self._could_be_date(value):
+            parsed_date = self._parse_date_string(value)
+            if parsed_date is not None:
+                return {
+                    'value': value,
+                    'type': 'date',
+                    'parsed_date': parsed_date.isoformat()
+                }
+
+        # Check for boolean strings (none is longer than five characters)
+        lower_value = value.lower() if len(value) <= 5 else ''
+        if lower_value in self.boolean_strings:
+            bool_value = lower_value in self.true_strings
             return {
                 'value': value,
                 'type': 'boolean_string',
@@ -166,6 +343,9 @@ class FrontmatterParser:
             }
 
         # Check for numeric strings
+        if not self._could_be_number(value):
+            return {'value': value, 'type': 'string'}
+
         try:
             if '.' in value:
                 float_value = float(value)
@@ -187,6 +367,77 @@ class FrontmatterParser:
         # Default to string
         return {'value': value, 'type': 'string'}
 
+    def _could_be_date(self, value: str) -> bool:
+        """
+        Cheap structural check that rules out strings the date pattern cannot match.
+
+        Most frontmatter strings are plain text, so this avoids running the
+        date regex against them. The pattern is ASCII-only and str.isascii()
+        is a constant-time flag check, so non-ASCII text is rejected first.
+
+        Args:
+            value: String value to check
+
+        Returns:
+            False if the value cannot be a date, True if it needs a full check
+        """
+        return value.isascii() and len(value) >= 10 and value[4] == '-' and value[7] == '-'
+
+    def _parse_date_string(self, value: str) -> Optional[datetime]:
+        """
+        Parse a date string with the compiled date pattern.
+
+        Fractional seconds are accepted but dropped from the parsed value.
+
+        Args:
+            value: String value to parse
+
+        Returns:
+            Parsed datetime, or None if the value is not a valid date
+        """
+        match = self.date_pattern.fullmatch(value)
+        if match is None:
+            return None
+
+        (year, month, day, iso_hour, iso_minute, iso_second, tz,
+         hour, minute, second) = match.groups()
+
+        tzinfo = None
+        if tz == 'Z':
+            tzinfo = timezone.utc
+        elif tz:
+            offset = timedelta(hours=int(tz[1:3]), minutes=int(tz[-2:]))
+            tzinfo = timezone(-offset if tz[0] == '-' else offset)
+
+        hour = iso_hour or hour or 0
+        minute = iso_minute or minute or 0
+        second = iso_second or second or 0
+
+        try:
+            return datetime(int(year), int(month), int(day),
+                            int(hour), int(minute), int(second), tzinfo=tzinfo)
+        except ValueError:
+            # Out-of-range components such as month 13
+            return None
+
+    def _could_be_number(self, value: str) -> bool:
+        """
+        Cheap check that rules out strings int() and float() would reject.
+
+        Args:
+            value: String value to check
+
+        Returns:
+            False if the value cannot be numeric, True if it needs a full check
+        """
+        first = value[:1]
+        if value.isascii() and first not in ' \t\n\r\f\v':
+            # ASCII fast path: a set lookup, no stripping or Unicode digit test
+            return first in self.number_start_chars
+
+        first = value.lstrip()[:1]
+        return first.isdigit() or (first != '' and first in '+-.')
+
     def _manual_parse(self, content: str) -> Dict[str, Any]:
         """
         Manually parse frontmatter when python-frontmatter fails.
@@ -204,6 +455,7 @@ class FrontmatterParser:
         # Try YAML frontmatter (--- delimited)
         yaml_match = re.match(r'^---\s*\n(.*?)\n---\s*\n', content, re.DOTALL)
         if yaml_match:
+            import yaml
             try:
                 yaml_content = yaml_match.group(1)
                 parsed = yaml.safe_load(yaml_content)
@@ -215,6 +467,7 @@ class FrontmatterParser:
         # Try JSON frontmatter ({} delimited)
         json_match = re.match(r'^{\s*\n(.*?)\n}\s*\n', content, re.DOTALL)
         if json_match:
+            import json
             try:
                 json_content = '{' + json_match.group(1) + '}'
                 parsed = json.loads(json_content)
@@ -226,6 +479,7 @@ class FrontmatterParser:
         # Try TOML frontmatter (+++ delimited)
         toml_match = re.match(r'^\+\+\+\s*\n(.*?)\n\+\+\+\s*\n', content, re.DOTALL)
         if toml_match:
+            import toml
             try:
                 toml_content = toml_match.group(1)
                 parsed = toml.loads(toml_content)
@@ -236,6 +490,44 @@ class FrontmatterParser:
 
         return {}
 
+    def parse_with_content(self, content: str) -> Tuple[Dict[str, Any], str]:
+        """
+        Extract frontmatter and the markdown content without it in one pass.
+
+        Equivalent to calling parse() and get_content_without_frontmatter(),
+        but YAML frontmatter delimiters are located only once and the same
+        bounds are used for both results.
+
+        Args:
+            content: Raw markdown file content
+
+        Returns:
+            Tuple of (typed frontmatter dictionary, content without frontmatter)
+        """
+        text = self._strip_leading(content)
+        if not text.startswith(('---', '{', '+++')):
+            # No frontmatter sentinel, so nothing to parse or cut off
+            return {}, text.strip()
+
+        opening = self.yaml_boundary.match(text) if text.startswith('---') else None
+        if opening is None:
+            # JSON/TOML frontmatter or none at all
+            return self.parse(content), self.get_content_without_frontmatter(content)
+
+        bounds = self._find_block_bounds(text, self.yaml_boundary, opening)
+        if bounds is None:
+            return {}, text.strip()
+
+        import yaml
+        try:
+            metadata = self._parse_yaml_block(text[opening.end():bounds[0]])
+        except yaml.YAMLError:
+            metadata = {}
+        except Exception:
+            metadata = self._manual_parse(content)
+
+        return metadata, text[bounds[1]:].strip()
+
     def get_content_without_frontmatter(self, content: str) -> str:
         """
         Extract the markdown content without frontmatter.
@@ -247,8 +539,27 @@ class FrontmatterParser:
             Markdown content with frontmatter removed
         """
         try:
-            post = frontmatter.loads(content)
-            return post.content
+            text = self._strip_leading(content)
+            if not text.startswith(('---', '{', '+++')):
+                return text.strip()
+
+            if text.startswith('---'):
+                boundary = self.yaml_boundary
+            elif text.startswith('+++'):
+                boundary = self.toml_boundary
+            else:
+                boundary = self.json_boundary
+
+            opening = boundary.match(text)
+            if opening is None:
+                return text.strip()
+
+            bounds = self._find_block_bounds(text, boundary, opening)
+            if bounds is None:
+                return text.strip()
+
+            # Slice the body once; the block itself is never parsed
+            return text[bounds[1]:].strip()
         except Exception:
             # Manual extraction if frontmatter library fails
             return self._manual_content_extraction(content)
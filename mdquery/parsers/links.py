@@ -3,8 +3,15 @@ Link parser for extracting and categorizing links from markdown content.
 """
 
 import re
+from functools import lru_cache
 from typing import Dict, List, Optional, Union
-from urllib.parse import urlparse
+from urllib.parse import urlsplit
+
+
+@lru_cache(maxsize=4096)
+def _url_scheme(target: str) -> str:
+    """Return the URL scheme of a link target, memoized as targets repeat."""
+    return urlsplit(target).scheme
 
 
 class LinkParser:
@@ -19,6 +26,13 @@ class LinkParser:
             re.MULTILINE
         )
 
+        # Start of a markdown link: "[text](". The target is then read by
+        # matching parentheses, which a regular expression cannot do
+        self.markdown_link_start_pattern = re.compile(r'\[([^\]]*)\]\(')
+
+        # Parentheses, for matching a link target's closing parenthesis
+        self.parenthesis_pattern = re.compile(r'[()]')
+
         # Wikilinks: [[page]] and [[page|alias]]
         self.wikilink_pattern = re.compile(
             r'\[\[([^|\]]+)(?:\|([^\]]+))?\]\]',
@@ -32,8 +46,10 @@ class LinkParser:
         )
 
         # Reference definitions: [ref]: url "title"
+        # Leading whitespace stops at the end of the line: with \s a run of
+        # blank lines was rescanned from every line start in it
         self.reference_def_pattern = re.compile(
-            r'^\s*\[([^\]]+)\]:\s*([^\s]+)(?:\s+"([^"]*)")?',
+            r'^[^\S\n]*\[([^\]]+)\]:\s*([^\s]+)(?:\s+"([^"]*)")?',
             re.MULTILINE
         )
 
@@ -55,14 +71,22 @@ class LinkParser:
         """
         links = []
 
-        # Parse reference definitions first (needed for reference links)
-        reference_defs = self._parse_reference_definitions(content)
+        # Every link type but auto-links starts with "[", so most passes can
+        # be skipped with a single substring check when the content has none
+        if '[' in content:
+            # Parse reference definitions first (needed for reference links)
+            reference_defs = self._parse_reference_definitions(content) if ']:' in content else {}
+
+            # Extract different types of links
+            links.extend(self._parse_markdown_links(content))
+            links.extend(self._parse_wikilinks(content))
+
+            # Reference links only resolve against a definition
+            if reference_defs:
+                links.extend(self._parse_reference_links(content, reference_defs))
 
-        # Extract different types of links
-        links.extend(self._parse_markdown_links(content))
-        links.extend(self._parse_wikilinks(content))
-        links.extend(self._parse_reference_links(content, reference_defs))
-        links.extend(self._parse_autolinks(content))
+        if '<' in content:
+            links.extend(self._parse_autolinks(content))
 
         return links
 
@@ -70,43 +94,19 @@ class LinkParser:
         """Parse standard markdown links [text](url)."""
         links = []
 
-        # Use a simpler approach: find [text]( and then manually parse the URL part
-        i = 0
-        while i < len(content):
-            # Find the start of a potential markdown link
-            start = content.find('[', i)
-            if start == -1:
+        pos = 0
+        while True:
+            # Find the next "[text](", starting from each "[" in turn
+            match = self.markdown_link_start_pattern.search(content, pos)
+            if match is None:
                 break
 
-            # Find the closing bracket
-            bracket_end = content.find(']', start + 1)
-            if bracket_end == -1:
-                i = start + 1
-                continue
-
-            # Check if this is followed by an opening parenthesis
-            if bracket_end + 1 >= len(content) or content[bracket_end + 1] != '(':
-                i = start + 1
-                continue
-
-            # Extract the link text
-            link_text = content[start + 1:bracket_end]
-
-            # Find the matching closing parenthesis, handling nested parentheses
-            paren_start = bracket_end + 2
-            paren_count = 1
-            paren_end = paren_start
+            link_text = match.group(1)
+            paren_start = match.end()
+            paren_end = self._find_closing_paren(content, paren_start)
 
-            while paren_end < len(content) and paren_count > 0:
-                if content[paren_end] == '(':
-                    paren_count += 1
-                elif content[paren_end] == ')':
-                    paren_count -= 1
-                paren_end += 1
-
-            if paren_count == 0:
-                # Successfully found matching parenthesis
-                link_target = content[paren_start:paren_end - 1].strip()
+            if paren_end != -1:
+                link_target = content[paren_start:paren_end].strip()
 
                 if link_target:  # Skip empty targets
                     links.append({
@@ -116,12 +116,44 @@ class LinkParser:
                         'is_internal': self._is_internal_link(link_target)
                     })
 
-                i = paren_end
+                pos = paren_end + 1
             else:
-                i = start + 1
+                pos = match.start() + 1
 
         return links
 
+    def _find_closing_paren(self, content: str, start: int) -> int:
+        """
+        Find the parenthesis closing one opened just before start.
+
+        Args:
+            content: Text being scanned
+            start: Index just after the opening parenthesis
+
+        Returns:
+            Index of the matching closing parenthesis, or -1 if it is unbalanced
+        """
+        close = content.find(')', start)
+        if close == -1:
+            return -1
+
+        # Common case: no nested parentheses before the first closing one
+        if content.find('(', start, close) == -1:
+            return close
+
+        # Jump from parenthesis to parenthesis rather than visiting every
+        # character, which matters when an unclosed link runs to the end
+        depth = 1
+        for match in self.parenthesis_pattern.finditer(content, start):
+            if match.group() == '(':
+                depth += 1
+            else:
+                depth -= 1
+                if depth == 0:
+                    return match.start()
+
+        return -1
+
     def _parse_wikilinks(self, content: str) -> List[Dict[str, Union[str, bool]]]:
         """Parse wikilinks [[page]] and [[page|alias]]."""
         links = []
@@ -151,10 +183,10 @@ class LinkParser:
 
         for match in self.reference_link_pattern.finditer(content):
             link_text = match.group(1).strip()
-            ref_key = match.group(2).strip() or link_text.lower()
+            ref_key = match.group(2).strip() or link_text
 
-            # Look up the reference definition
-            link_target = reference_defs.get(ref_key.lower())
+            # Look up the reference definition; labels match case-insensitively
+            link_target = reference_defs.get(ref_key.casefold())
 
             if link_target:
                 links.append({
@@ -187,7 +219,8 @@ class LinkParser:
         reference_defs = {}
 
         for match in self.reference_def_pattern.finditer(content):
-            ref_key = match.group(1).strip().lower()
+            # Case-folded once here, so a lookup folds only the label it uses
+            ref_key = match.group(1).strip().casefold()
             url = match.group(2).strip()
 
             reference_defs[ref_key] = url
@@ -208,11 +241,10 @@ class LinkParser:
         if not target:
             return True
 
-        # Parse the URL
-        parsed = urlparse(target)
-
-        # If it has a scheme (http, https, ftp, etc.), it's external
-        if parsed.scheme:
+        # If it has a scheme (http, https, ftp, etc.), it's external. urlsplit
+        # only finds a scheme before a colon, so targets without one (page
+        # names, anchors, relative paths) skip URL parsing entirely
+        if ':' in target and _url_scheme(target):
             return False
 
         # If it starts with //, it's a protocol-relative external URL
@@ -4,13 +4,11 @@ Markdown content parser for extracting content, headings, and structure.
 
 import re
 from typing import Dict, List, Tuple, NamedTuple
-from dataclasses import dataclass
 import markdown
 from markdown.extensions import toc
 
 
-@dataclass
-class HeadingInfo:
+class HeadingInfo(NamedTuple):
     """Information about a heading in the markdown content."""
     level: int
     text: str
@@ -51,6 +49,51 @@ class MarkdownParser:
             }
         )
 
+        # Heading patterns
+        self.atx_pattern = re.compile(r'^(#{1,6})\s+(.+?)(?:\s+#*)?$')  # # Heading
+        self.setext_pattern1 = re.compile(r'^=+$')  # ===== (H1)
+        self.setext_pattern2 = re.compile(r'^-+$')  # ----- (H2)
+
+        # Anchor patterns
+        self.anchor_format_pattern = re.compile(r'[*_`~]')
+        self.anchor_strip_pattern = re.compile(r'[^\w\s-]')
+        self.anchor_separator_pattern = re.compile(r'[-\s]+')
+
+        # Plain text substitutions, applied in order
+        self.plain_text_substitutions = [
+            # Remove code blocks first (to avoid processing their content)
+            (re.compile(r'```[\s\S]*?```'), ' '),
+            (re.compile(r'`([^`]+)`'), r'\1'),  # Keep inline code content
+            # Remove HTML tags
+            (re.compile(r'<[^>]+>'), ' '),
+            # Remove markdown formatting
+            (re.compile(r'!\[([^\]]*)\]\([^)]+\)'), r'\1'),  # Images
+            (re.compile(r'\[([^\]]+)\]\([^)]+\)'), r'\1'),   # Links
+            (re.compile(r'\[([^\]]+)\]\[[^\]]*\]'), r'\1'), # Reference links
+            (re.compile(r'\[\[([^\]]+)\]\]'), r'\1'),       # Wikilinks
+            (re.compile(r'\*\*([^*]+)\*\*'), r'\1'),        # Bold
+            (re.compile(r'__([^_]+)__'), r'\1'),            # Bold alt
+            (re.compile(r'\*([^*]+)\*'), r'\1'),            # Italic
+            (re.compile(r'_([^_]+)_'), r'\1'),              # Italic alt
+            (re.compile(r'~~([^~]+)~~'), r'\1'),            # Strikethrough
+            (re.compile(r'^#{1,6}\s+', re.MULTILINE), ''),  # Headings
+            (re.compile(r'^[=-]+$', re.MULTILINE), ''),     # Setext underlines
+            (re.compile(r'^\s*[-*+]\s+', re.MULTILINE), ''),  # List bullets
+            (re.compile(r'^\s*\d+\.\s+', re.MULTILINE), ''),  # Numbered lists
+            (re.compile(r'^>\s*', re.MULTILINE), ''),         # Blockquotes
+            (re.compile(r'^\s*\|.*\|.*$', re.MULTILINE), ''), # Tables
+        ]
+
+        # Whitespace and FTS5 cleanup patterns
+        self.whitespace_pattern = re.compile(r'\s+')
+        self.control_char_pattern = re.compile(r'[\x00-\x08\x0B\x0C\x0E-\x1F\x7F]')
+
+        # Byte table mapping ASCII whitespace to b' ' and everything else to b'x',
+        # used to count words without building a list of substrings
+        self.word_count_table = bytes(
+            0x20 if chr(byte).isspace() else 0x78 for byte in range(256)
+        )
+
     def parse(self, content: str) -> ParsedMarkdown:
         """
         Parse markdown content to extract text, headings, and word count.
@@ -64,13 +107,8 @@ class MarkdownParser:
         if not content.strip():
             return ParsedMarkdown("", [], 0, {}, "")
 
-        # Reset the markdown parser state
-        self.md.reset()
-
-        # Convert markdown to HTML to extract structure
-        html_content = self.md.convert(content)
-
-        # Extract headings from the TOC extension
+        # Structure is extracted from the markdown source directly; HTML is
+        # only rendered on request through to_html()
         headings = self._extract_headings(content)
 
         # Create heading hierarchy
@@ -83,7 +121,7 @@ class MarkdownParser:
         sanitized_content = self._sanitize_for_fts5(plain_text)
 
         # Count words in plain text
-        word_count = self._count_words(plain_text)
+        word_count = self.count_words(plain_text)
 
         return ParsedMarkdown(
             sanitized_content=sanitized_content,
@@ -93,15 +131,28 @@ class MarkdownParser:
             plain_text=plain_text
         )
 
+    def to_html(self, content: str) -> str:
+        """
+        Render markdown content to HTML.
+
+        Args:
+            content: Markdown content (without frontmatter)
+
+        Returns:
+            Rendered HTML
+        """
+        # Reset the markdown parser state
+        self.md.reset()
+        return self.md.convert(content)
+
     def _extract_headings(self, content: str) -> List[HeadingInfo]:
         """Extract headings with their levels and text."""
         headings = []
         lines = content.split('\n')
 
-        # Regex patterns for different heading styles
-        atx_pattern = re.compile(r'^(#{1,6})\s+(.+?)(?:\s+#*)?$')  # # Heading
-        setext_pattern1 = re.compile(r'^=+$')  # ===== (H1)
-        setext_pattern2 = re.compile(r'^-+$')  # ----- (H2)
+        atx_pattern = self.atx_pattern
+        setext_pattern1 = self.setext_pattern1
+        setext_pattern2 = self.setext_pattern2
 
         for i, line in enumerate(lines):
             line = line.strip()
@@ -132,10 +183,10 @@ class MarkdownParser:
     def _create_anchor(self, text: str) -> str:
         """Create URL-safe anchor from heading text."""
         # Remove markdown formatting
-        text = re.sub(r'[*_`~]', '', text)
+        text = self.anchor_format_pattern.sub('', text)
         # Convert to lowercase and replace spaces/special chars with hyphens
-        anchor = re.sub(r'[^\w\s-]', '', text.lower())
-        anchor = re.sub(r'[-\s]+', '-', anchor)
+        anchor = self.anchor_strip_pattern.sub('', text.lower())
+        anchor = self.anchor_separator_pattern.sub('-', anchor)
         return anchor.strip('-')
 
     def _build_heading_hierarchy(self, headings: List[HeadingInfo]) -> Dict[str, List[str]]:
@@ -162,33 +213,11 @@ class MarkdownParser:
 
     def _extract_plain_text(self, content: str) -> str:
         """Extract plain text from markdown, removing all formatting."""
-        # Remove code blocks first (to avoid processing their content)
-        content = re.sub(r'```[\s\S]*?```', ' ', content)
-        content = re.sub(r'`([^`]+)`', r'\1', content)  # Keep inline code content
+        for pattern, replacement in self.plain_text_substitutions:
+            content = pattern.sub(replacement, content)
 
-        # Remove HTML tags
-        content = re.sub(r'<[^>]+>', ' ', content)
-
-        # Remove markdown formatting
-        content = re.sub(r'!\[([^\]]*)\]\([^)]+\)', r'\1', content)  # Images
-        content = re.sub(r'\[([^\]]+)\]\([^)]+\)', r'\1', content)   # Links
-        content = re.sub(r'\[([^\]]+)\]\[[^\]]*\]', r'\1', content) # Reference links
-        content = re.sub(r'\[\[([^\]]+)\]\]', r'\1', content)       # Wikilinks
-        content = re.sub(r'\*\*([^*]+)\*\*', r'\1', content)        # Bold
-        content = re.sub(r'__([^_]+)__', r'\1', content)            # Bold alt
-        content = re.sub(r'\*([^*]+)\*', r'\1', content)            # Italic
-        content = re.sub(r'_([^_]+)_', r'\1', content)              # Italic alt
-        content = re.sub(r'~~([^~]+)~~', r'\1', content)            # Strikethrough
-        content = re.sub(r'^#{1,6}\s+', '', content, flags=re.MULTILINE)  # Headings
-        content = re.sub(r'^[=-]+$', '', content, flags=re.MULTILINE)     # Setext underlines
-        content = re.sub(r'^\s*[-*+]\s+', '', content, flags=re.MULTILINE)  # List bullets
-        content = re.sub(r'^\s*\d+\.\s+', '', content, flags=re.MULTILINE)  # Numbered lists
-        content = re.sub(r'^>\s*', '', content, flags=re.MULTILINE)         # Blockquotes
-        content = re.sub(r'^\s*\|.*\|.*$', '', content, flags=re.MULTILINE) # Tables
-
-        # Clean up whitespace
-        content = re.sub(r'\n+', ' ', content)
-        content = re.sub(r'\s+', ' ', content)
+        # Clean up whitespace (newline runs are whitespace runs too)
+        content = self.whitespace_pattern.sub(' ', content)
 
         return content.strip()
 
@@ -205,21 +234,34 @@ class MarkdownParser:
         sanitized = sanitized.replace('…', '...')
 
         # Remove control characters except newlines and tabs
-        sanitized = re.sub(r'[\x00-\x08\x0B\x0C\x0E-\x1F\x7F]', '', sanitized)
+        sanitized = self.control_char_pattern.sub('', sanitized)
 
         # Normalize whitespace
-        sanitized = re.sub(r'\s+', ' ', sanitized)
+        sanitized = self.whitespace_pattern.sub(' ', sanitized)
 
         return sanitized.strip()
 
-    def _count_words(self, text: str) -> int:
-        """Count words in the text."""
-        if not text.strip():
+    def count_words(self, text: str) -> int:
+        """
+        Count whitespace-separated words in the text.
+
+        Gives the same result as ``len(text.split())``.
+
+        Args:
+            text: Text to count words in
+
+        Returns:
+            Number of words
+        """
+        if not text:
             return 0
 
-        # Split on whitespace and filter out empty strings
-        words = [word for word in re.split(r'\s+', text.strip()) if word]
-        return len(words)
+        if not text.isascii():
+            return len(text.split())
+
+        # Every word starts at a non-space byte that follows a space (or the start)
+        marks = text.encode('ascii').translate(self.word_count_table)
+        return marks.count(b' x') + (marks[0] == 0x78)
 
     def get_heading_text_only(self, headings: List[HeadingInfo]) -> List[str]:
         """Extract just the heading text for simple queries."""
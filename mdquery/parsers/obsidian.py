@@ -6,7 +6,7 @@ including wikilinks, backlinks, template syntax, and graph structure mapping.
 """
 
 import re
-from typing import Dict, List, Set, Optional, Any, Tuple
+from typing import Dict, Iterable, List, Set, Optional, Any, Tuple
 from pathlib import Path
 
 from .links import LinkParser
@@ -431,10 +431,20 @@ class ObsidianParser:
         Returns:
             List of normalized tags
         """
-        tags = set()
-
         # Use the enhanced tag pattern for Obsidian
-        matches = self.obsidian_tag_pattern.findall(content)
+        return self.normalize_obsidian_tags(self.obsidian_tag_pattern.findall(content))
+
+    def normalize_obsidian_tags(self, matches: Iterable[str]) -> List[str]:
+        """
+        Normalize raw tag matches according to Obsidian conventions.
+
+        Args:
+            matches: Tag names captured from the content, without the leading hash
+
+        Returns:
+            List of normalized tags
+        """
+        tags = set()
 
         for match in matches:
             # Normalize the tag
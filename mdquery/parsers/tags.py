@@ -3,7 +3,7 @@ Tag parser for extracting tags from frontmatter and inline content.
 """
 
 import re
-from typing import Any, Dict, List, Set, Union
+from typing import Any, Dict, Iterable, List, Set, Union
 
 
 class TagParser:
@@ -18,6 +18,10 @@ class TagParser:
             re.MULTILINE
         )
 
+        # Patterns used when normalizing tags
+        self.whitespace_pattern = re.compile(r'\s+')
+        self.invalid_char_pattern = re.compile(r'[^a-z0-9_/-]')
+
         # Common frontmatter keys that contain tags
         self.tag_keys = {'tags', 'tag', 'categories', 'category', 'keywords', 'topics'}
 
@@ -50,10 +54,19 @@ class TagParser:
         Returns:
             List of normalized tag strings
         """
-        tags = set()
+        return self.normalize_inline_tags(self.hashtag_pattern.findall(content))
+
+    def normalize_inline_tags(self, matches: Iterable[str]) -> List[str]:
+        """
+        Normalize raw hashtag matches found by ``hashtag_pattern``.
+
+        Args:
+            matches: Tag names captured from the content, without the leading hash
 
-        # Find all hashtag matches
-        matches = self.hashtag_pattern.findall(content)
+        Returns:
+            List of normalized tag strings
+        """
+        tags = set()
 
         for match in matches:
             # Normalize the tag
@@ -173,16 +186,14 @@ class TagParser:
         tag = tag.lower()
 
         # Replace spaces with hyphens (common convention)
-        tag = re.sub(r'\s+', '-', tag)
+        tag = self.whitespace_pattern.sub('-', tag)
 
         # Remove any characters that aren't alphanumeric, underscore, hyphen, or forward slash
         # Do this before other validations to clean up the string
-        tag = re.sub(r'[^a-z0-9_/-]', '', tag)
+        tag = self.invalid_char_pattern.sub('', tag)
 
-        # Check if the original tag (before cleaning) ends with invalid characters
-        # This helps reject tags like "invalid-" or "tag/"
-        original_clean = re.sub(r'[^a-z0-9_/-]', '', tag)
-        if original_clean.endswith('-') or original_clean.endswith('/') or original_clean.startswith('-') or original_clean.startswith('/'):
+        # Reject tags that start or end with a separator, like "invalid-" or "tag/"
+        if tag.startswith(('-', '/')) or tag.endswith(('-', '/')):
             return ""
 
         # Remove leading/trailing hyphens or slashes
@@ -20,14 +20,9 @@ class TestCacheManager:
     """Test cases for CacheManager class."""
 
     @pytest.fixture
-    def temp_db_path(self):
+    def temp_db_path(self, tmp_path):
         """Create a temporary database path for testing."""
-        with tempfile.NamedTemporaryFile(suffix='.db', delete=False) as f:
-            db_path = Path(f.name)
-        yield db_path
-        # Cleanup
-        if db_path.exists():
-            db_path.unlink()
+        return tmp_path / "test_cache.db"
 
     @pytest.fixture
     def db_manager(self, temp_db_path):
@@ -351,6 +346,35 @@ class TestCacheManager:
             assert stats['files_checked'] == 1
             assert stats['files_removed'] == 0
 
+    def test_cleanup_orphaned_entries_dangling_symlink(self, cache_manager):
+        """Test that a listed but dangling symlink still counts as orphaned."""
+        cache_manager.initialize_cache()
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            temp_path = Path(temp_dir)
+            existing_file = temp_path / "existing.md"
+            existing_file.write_text("# Existing file")
+            dangling_link = temp_path / "dangling.md"
+            dangling_link.symlink_to(temp_path / "missing.md")
+
+            with cache_manager.db_manager.get_connection() as conn:
+                for file_path in (existing_file, dangling_link):
+                    conn.execute("""
+                        INSERT INTO files (path, filename, directory, modified_date, file_size, content_hash)
+                        VALUES (?, ?, ?, ?, ?, ?)
+                    """, (str(file_path), file_path.name, str(temp_path),
+                         datetime.now().isoformat(), 100, "hash"))
+                conn.commit()
+
+            stats = cache_manager.cleanup_orphaned_entries()
+
+            assert stats['files_checked'] == 2
+            assert stats['files_removed'] == 1
+
+            with cache_manager.db_manager.get_connection() as conn:
+                cursor = conn.execute("SELECT path FROM files")
+                assert [row[0] for row in cursor.fetchall()] == [str(existing_file)]
+
     def test_cleanup_orphaned_entries_database_error(self, cache_manager):
         """Test cleanup with database error."""
         cache_manager.initialize_cache()
@@ -6,10 +6,8 @@ in realistic scenarios with actual markdown files.
 """
 
 import pytest
-import tempfile
 import time
 from datetime import datetime, timedelta
-from pathlib import Path
 
 from mdquery.cache import CacheManager
 from mdquery.database import DatabaseManager
@@ -20,10 +18,9 @@ class TestCacheIntegration:
     """Integration test cases for cache management with indexer."""
 
     @pytest.fixture
-    def temp_dir(self):
+    def temp_dir(self, tmp_path):
         """Create a temporary directory for test files."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            yield Path(temp_dir)
+        return tmp_path
 
     @pytest.fixture
     def temp_db_path(self, temp_dir):
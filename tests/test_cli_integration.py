@@ -152,6 +152,12 @@ This file is in a subdirectory.
         assert 'Files processed: 5' in result.output
         assert 'Total files in index: 5' in result.output
 
+    def test_index_directory_workers(self):
+        """Test full directory indexing with worker processes."""
+        result = self.runner.invoke(cli, ['index', str(self.temp_dir), '--full', '--workers', '2'])
+        assert result.exit_code == 0
+        assert 'Files processed: 5' in result.output
+
     def test_index_directory_non_recursive(self):
         """Test non-recursive directory indexing."""
         result = self.runner.invoke(cli, ['index', str(self.temp_dir), '--no-recursive'])
@@ -8,6 +8,7 @@ and validation functionality.
 import pytest
 import sqlite3
 import tempfile
+import threading
 from pathlib import Path
 from unittest.mock import patch, MagicMock
 
@@ -303,6 +304,31 @@ class TestDatabaseManager:
         assert "row_count" in files_info
         assert "sql" in files_info
 
+    def test_get_schema_info_tracks_changes(self):
+        """Test cached schema structure picks up new tables and row counts."""
+        db_manager = DatabaseManager()
+        db_manager.initialize_database()
+
+        first = db_manager.get_schema_info()
+        assert first["tables"]["files"]["row_count"] == 0
+        assert "extra_notes" not in first["tables"]
+
+        with db_manager.get_connection() as conn:
+            conn.execute("CREATE TABLE extra_notes (id INTEGER PRIMARY KEY)")
+            conn.execute("""
+                INSERT INTO files (path, filename, directory, modified_date, file_size, content_hash)
+                VALUES ('/test/note.md', 'note.md', '/test', '2024-01-01T00:00:00', 100, 'abc')
+            """)
+            conn.commit()
+
+        second = db_manager.get_schema_info()
+        assert second["tables"]["files"]["row_count"] == 1
+        assert second["tables"]["extra_notes"]["columns"][0]["name"] == "id"
+
+        # Callers get their own copy of the cached structure
+        second["tables"]["files"]["columns"].clear()
+        assert db_manager.get_schema_info()["tables"]["files"]["columns"]
+
     def test_validate_schema_success(self):
         """Test successful schema validation."""
         db_manager = DatabaseManager()
@@ -349,6 +375,46 @@ class TestDatabaseManager:
         # Connection should be closed after context exit
         assert db_manager._connection is None
 
+    def test_connection_per_thread(self):
+        """Test file databases use one connection per thread and memory databases share one."""
+        def connection_in_thread(db_manager):
+            result = []
+
+            def worker():
+                with db_manager.get_connection() as conn:
+                    result.append(conn)
+            thread = threading.Thread(target=worker)
+            thread.start()
+            thread.join()
+            return result[0]
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            db_manager = DatabaseManager(Path(temp_dir) / "test.db")
+            db_manager.initialize_database()
+
+            with db_manager.get_connection() as conn:
+                main_conn = conn
+                conn.execute("INSERT INTO files (path, filename, directory, modified_date, file_size, content_hash) "
+                             "VALUES ('/a.md', 'a.md', '/', '2024-01-01', 1, 'h')")
+                conn.commit()
+
+            with db_manager.get_connection() as conn:
+                assert conn is main_conn
+
+            thread_conn = connection_in_thread(db_manager)
+            assert thread_conn is not main_conn
+            assert thread_conn.execute("SELECT COUNT(*) FROM files").fetchone()[0] == 1
+
+            db_manager.close()
+            with db_manager.get_connection() as conn:
+                assert conn is not main_conn
+            db_manager.close()
+
+        memory_manager = DatabaseManager()
+        with memory_manager.get_connection() as conn:
+            assert connection_in_thread(memory_manager) is conn
+        memory_manager.close()
+
     def test_connection_error_handling(self):
         """Test database connection error handling."""
         # Test with invalid database path
@@ -371,6 +437,28 @@ class TestDatabaseManager:
             # This should not raise an error
             db_manager._run_migrations(conn, 1)
 
+    def test_migration_to_version_3_keys_fts_by_file_id(self):
+        """Test migrating full-text rows to use the file id as rowid."""
+        db_manager = DatabaseManager()
+        db_manager.initialize_database()
+
+        with db_manager.get_connection() as conn:
+            conn.execute("""
+                INSERT INTO files (id, path, filename, directory, modified_date, file_size, content_hash)
+                VALUES (7, '/a.md', 'a.md', '/', '2024-01-01T00:00:00', 1, 'h')
+            """)
+            # Rows as written before version 3: automatic rowids, plus a
+            # leftover row for a file that is no longer indexed
+            conn.execute("INSERT INTO content_fts (file_id, title, content, headings) VALUES (3, 'old', 'gone', '')")
+            conn.execute("INSERT INTO content_fts (file_id, title, content, headings) VALUES (7, 'A', 'body', '')")
+
+            db_manager._migrate_to_version_3(conn)
+
+            rows = conn.execute("SELECT rowid, file_id, title FROM content_fts").fetchall()
+            assert [tuple(row) for row in rows] == [(7, 7, 'A')]
+
+        db_manager.close()
+
 
 class TestCreateDatabase:
     """Test cases for create_database function."""
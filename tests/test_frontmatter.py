@@ -172,7 +172,7 @@ Content.
         assert all(item == 'string' for item in result['string_array']['item_types'])
 
         assert result['mixed_array']['type'] == 'array'
-        expected_types = ['string', 'number', 'boolean', 'date']
+        expected_types = ('string', 'number', 'boolean', 'date')
         assert result['mixed_array']['item_types'] == expected_types
 
         assert result['nested_array']['type'] == 'array'
@@ -207,6 +207,29 @@ Content.
         config_obj = result['config']['value']
         assert config_obj['features']['type'] == 'array'
 
+    def test_yaml_anchors_and_merge_keys(self):
+        """Test YAML aliases and merge keys resolve to typed values."""
+        content = """---
+defaults: &defaults
+  draft: true
+  weight: 5
+post:
+  <<: *defaults
+  weight: 10
+created: 2023-12-01
+alias: *defaults
+---
+
+Content.
+"""
+        result = self.parser.parse(content)
+
+        post = result['post']['value']
+        assert post['draft'] == {'value': True, 'type': 'boolean'}
+        assert post['weight'] == {'value': 10, 'type': 'number'}
+        assert result['created']['type'] == 'date'
+        assert result['alias']['value']['weight']['value'] == 5
+
     def test_date_parsing(self):
         """Test various date format parsing."""
         content = """---
@@ -224,6 +247,30 @@ Content.
             assert result[key]['type'] == 'date'
             assert 'parsed_date' in result[key]
 
+    def test_string_classification_edge_cases(self):
+        """Test scalar classification for strings near the type boundaries."""
+        assert self.parser._infer_type('-5')['type'] == 'number_string'
+        assert self.parser._infer_type('.5')['numeric_value'] == 0.5
+        assert self.parser._infer_type('v1.2')['type'] == 'string'
+        assert self.parser._infer_type('inf')['type'] == 'string'
+        assert self.parser._infer_type('2023-12')['type'] == 'string'
+        assert self.parser._infer_type('2023/12/01')['type'] == 'string'
+        assert self.parser._infer_type('')['type'] == 'string'
+
+    def test_date_string_parsing(self):
+        """Test parsed values for date strings with fractions and timezones."""
+        result = self.parser._infer_type('2023-12-01T10:30:00.000Z')
+        assert result['parsed_date'] == '2023-12-01T10:30:00+00:00'
+
+        result = self.parser._infer_type('2023-12-01T10:30:00-05:00')
+        assert result['parsed_date'] == '2023-12-01T10:30:00-05:00'
+
+        result = self.parser._infer_type('2023-12-01 15:45:30')
+        assert result['parsed_date'] == '2023-12-01T15:45:30'
+
+        assert self.parser._infer_type('2023-13-01')['type'] == 'string'
+        assert self.parser._infer_type('2023-12-01T10:30:00 extra')['type'] == 'string'
+
     def test_no_frontmatter(self):
         """Test parsing content with no frontmatter."""
         content = """# Just a regular markdown file
@@ -233,6 +280,15 @@ This has no frontmatter at all.
         result = self.parser.parse(content)
         assert result == {}
 
+    def test_byte_order_mark_before_frontmatter(self):
+        """Test frontmatter is detected after a UTF-8 byte order mark."""
+        content = "\ufeff---\ntitle: With BOM\n---\n\n# Body\n"
+
+        result = self.parser.parse(content)
+
+        assert result['title']['value'] == 'With BOM'
+        assert self.parser.get_content_without_frontmatter(content) == "# Body"
+
     def test_empty_frontmatter(self):
         """Test parsing with empty frontmatter."""
         content = """---
@@ -258,6 +314,28 @@ Content.
         # The exact behavior depends on implementation, but it shouldn't crash
         assert isinstance(result, dict)
 
+    def test_malformed_yaml_not_reparsed(self, monkeypatch):
+        """Test malformed YAML is rejected without the manual fallback."""
+        def fail_manual_parse(content):
+            raise AssertionError("manual fallback should not run")
+
+        monkeypatch.setattr(self.parser, '_manual_parse', fail_manual_parse)
+        content = "---\ninvalid: [unclosed array\n---\n\nContent.\n"
+        assert self.parser.parse(content) == {}
+
+    def test_quotes_inside_values_are_not_malformed(self):
+        """Test unbalanced quote characters inside valid YAML still parse."""
+        content = """---
+quote: 'He said "hi'
+bracket: "[draft"
+---
+
+Content.
+"""
+        result = self.parser.parse(content)
+        assert result['quote']['value'] == 'He said "hi'
+        assert result['bracket']['value'] == '[draft'
+
     def test_content_extraction_yaml(self):
         """Test extracting content without YAML frontmatter."""
         content = """---
@@ -271,6 +349,17 @@ This is the actual content.
         expected = "# Main Content\nThis is the actual content."
         assert extracted.strip() == expected
 
+    def test_content_extraction_malformed_yaml(self):
+        """Test content extraction does not depend on the YAML being valid."""
+        content = """---
+invalid: [unclosed array
+---
+
+# Body
+"""
+        extracted = self.parser.get_content_without_frontmatter(content)
+        assert extracted == "# Body"
+
     def test_content_extraction_json(self):
         """Test extracting content without JSON frontmatter."""
         content = """{
@@ -297,6 +386,33 @@ This follows TOML frontmatter.
         assert "# TOML Content" in extracted
         assert "title" not in extracted
 
+    def test_parse_with_content_matches_separate_calls(self):
+        """Test that the combined parse returns the same as parse() plus content extraction."""
+        samples = [
+            "---\ntitle: Test\ntags: [a, b]\n---\n\n# Body\n",
+            "---\ninvalid: [unclosed\n---\n\n# Body\n",
+            "---\ntitle: Unclosed\n\n# Body\n",
+            "\ufeff---\ntitle: BOM\n---\nBody",
+            "+++\ntitle = \"TOML\"\n+++\n\n# Body\n",
+            "{\n\"title\": \"JSON\"\n}\n\n# Body\n",
+            "# No frontmatter\n\nJust content.\n",
+            "",
+        ]
+
+        for content in samples:
+            assert self.parser.parse_with_content(content) == (
+                self.parser.parse(content),
+                self.parser.get_content_without_frontmatter(content)
+            )
+
+    def test_content_extraction_invalid_toml_and_json(self):
+        """Test that TOML/JSON blocks are stripped without being parsed."""
+        toml_content = "+++\ntitle = \n+++\n\n# Body\n"
+        json_content = "{\n\"title\": \n}\n\n# Body {braces}\n"
+
+        assert self.parser.get_content_without_frontmatter(toml_content) == "# Body"
+        assert self.parser.get_content_without_frontmatter(json_content) == "# Body {braces}"
+
     def test_content_extraction_no_frontmatter(self):
         """Test content extraction when there's no frontmatter."""
         content = """# Regular Markdown
@@ -452,6 +568,23 @@ Content.
         assert len(result['tags']['value']) == 100
         assert len(result['description']['value']) == 1000
 
+    def test_parse_many(self, tmp_path):
+        """Test batch parsing of files across worker processes."""
+        paths = []
+        for i in range(4):
+            path = tmp_path / f"note_{i}.md"
+            path.write_text(f"---\ntitle: Note {i}\n---\n\nBody {i}.\n", encoding='utf-8')
+            paths.append(path)
+        paths.append(tmp_path / "plain.md")
+        paths[-1].write_text("# No frontmatter\n", encoding='utf-8')
+
+        results = FrontmatterParser.parse_many(paths, workers=2)
+
+        assert [r.get('title', {}).get('value') for r in results] == [
+            'Note 0', 'Note 1', 'Note 2', 'Note 3', None
+        ]
+        assert FrontmatterParser.parse_many(paths, workers=1) == results
+
 
 if __name__ == '__main__':
     pytest.main([__file__])
\ No newline at end of file
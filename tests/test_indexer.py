@@ -3,11 +3,9 @@ Unit tests for the file indexing engine.
 """
 
 import os
-import tempfile
 import pytest
 from datetime import datetime
 from pathlib import Path
-from unittest.mock import Mock, patch
 
 from mdquery.indexer import Indexer, IndexingError
 from mdquery.database import DatabaseManager
@@ -18,10 +16,9 @@ class TestIndexer:
     """Test cases for the Indexer class."""
 
     @pytest.fixture
-    def temp_dir(self):
+    def temp_dir(self, tmp_path):
         """Create a temporary directory for testing."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            yield Path(temp_dir)
+        return tmp_path
 
     @pytest.fixture
     def db_manager(self):
@@ -84,6 +81,30 @@ class TestIndexer:
         assert len(files) == 1
         assert files[0].name == "file1.md"
 
+    def test_scan_directory_skips_directory_symlinks(self, indexer, temp_dir):
+        """Test that scanning skips symlinked directories and markdown-named directories."""
+        self.create_test_file(temp_dir / "notes" / "note.md", "# Note")
+        (temp_dir / "folder.md").mkdir()
+        try:
+            os.symlink(temp_dir / "notes", temp_dir / "loop", target_is_directory=True)
+        except (OSError, NotImplementedError):
+            pytest.skip("Symlinks not supported on this platform")
+
+        files = indexer._scan_directory(temp_dir, recursive=True)
+
+        assert files == [temp_dir / "notes" / "note.md"]
+
+    def test_scan_directory_matches_extensions_like_suffix(self, indexer, temp_dir):
+        """Test extension matching is case-insensitive and ignores bare dotfiles."""
+        self.create_test_file(temp_dir / "UPPER.MD", "# Upper")
+        self.create_test_file(temp_dir / "archive.tar.mdx", "# Double suffix")
+        self.create_test_file(temp_dir / ".md", "# Dotfile")
+        self.create_test_file(temp_dir / "readme.md.txt", "Not markdown")
+
+        files = indexer._scan_directory(temp_dir, recursive=True)
+
+        assert sorted(f.name for f in files) == ["UPPER.MD", "archive.tar.mdx"]
+
     def test_extract_file_metadata(self, indexer, temp_dir):
         """Test file metadata extraction."""
         test_file = self.create_test_file(temp_dir / "test.md", "# Test Content")
@@ -114,6 +135,43 @@ class TestIndexer:
         hash3 = indexer._calculate_content_hash(test_file)
         assert hash1 != hash3
 
+    def test_large_file_memory_mapped(self, indexer, temp_dir):
+        """Test files of 1 MiB or more are hashed and decoded from a memory map."""
+        import hashlib
+        import mmap
+
+        content = "# Large\r\n\nCaf\u00e9 text with #tag\n" * 40000
+        test_file = temp_dir / "large.md"
+        test_file.write_bytes(content.encode('utf-8'))
+        file_bytes = test_file.read_bytes()
+        assert len(file_bytes) >= 1024 * 1024
+
+        assert indexer._calculate_content_hash(test_file) == hashlib.sha256(file_bytes).hexdigest()
+
+        raw = indexer._read_file_bytes(test_file, len(file_bytes))
+        try:
+            assert isinstance(raw, mmap.mmap)
+            assert indexer._decode_content(raw, test_file) == indexer._decode_content(file_bytes, test_file)
+        finally:
+            raw.close()
+
+        # Without a size from an earlier stat the file is read into bytes
+        assert indexer._read_file_bytes(test_file) == file_bytes
+
+    def test_calculate_content_hash_fast(self, db_manager, temp_dir):
+        """Test content hashing with the optional fast hash."""
+        indexer = Indexer(db_manager, fast_hash=True)
+        test_file = self.create_test_file(temp_dir / "test.md", "# Test Content")
+
+        hash1 = indexer._calculate_content_hash(test_file)
+
+        # XXH3-128 when xxhash is installed, SHA-256 otherwise
+        assert len(hash1) in (32, 64)
+        assert hash1 == indexer._calculate_content_hash(test_file)
+
+        test_file.write_text("# Different Content")
+        assert indexer._calculate_content_hash(test_file) != hash1
+
     def test_read_file_content_utf8(self, indexer, temp_dir):
         """Test reading UTF-8 encoded files."""
         content = "# Test with émojis 🚀 and ñoñó"
@@ -133,6 +191,57 @@ class TestIndexer:
         content = indexer._read_file_content(test_file)
         assert "Test with special chars" in content
 
+    def test_prefetch_file_bytes(self, indexer, temp_dir):
+        """Test read-ahead of file bytes keeps order and reports unreadable files."""
+        paths = [self.create_test_file(temp_dir / f"file{i}.md", f"# File {i}\r\n") for i in range(5)]
+        paths.insert(2, temp_dir / "missing.md")
+
+        results = list(indexer._prefetch_file_bytes(paths, depth=2))
+
+        assert len(results) == 6
+        assert results[2][0] is None
+        assert isinstance(results[2][1], FileNotFoundError)
+        assert [raw for raw, error in results if error is None] == [
+            f"# File {i}\r\n".encode('utf-8') for i in range(5)
+        ]
+        assert indexer._decode_content(results[0][0], paths[0]) == "# File 0\n"
+
+    def test_memory_maps_closed_on_early_exit(self, indexer, temp_dir):
+        """Test memory maps are closed when loading fails validation or read-ahead stops."""
+        import mmap
+        import time
+
+        large_file = temp_dir / "large.txt"
+        large_file.write_bytes(b"# Large\n" * (128 * 1024))
+        file_size = large_file.stat().st_size
+
+        raw = indexer._read_file_bytes(large_file, file_size)
+        assert isinstance(raw, mmap.mmap)
+        with pytest.raises(Exception, match="not a markdown file"):
+            indexer._load_file(large_file, large_file.stat(), raw)
+        assert raw.closed
+
+        maps = []
+
+        def read_mapped(path, size=0):
+            mapped = Indexer._read_file_bytes(indexer, path, file_size)
+            maps.append(mapped)
+            return mapped
+
+        indexer._read_file_bytes = read_mapped
+        contents = indexer._prefetch_file_bytes([large_file] * 4, depth=3)
+        first, _ = next(contents)
+
+        # Let the read-ahead threads map the remaining files
+        deadline = time.monotonic() + 5
+        while len(maps) < 4 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        contents.close()
+
+        assert len(maps) == 4
+        assert [mapped.closed for mapped in maps if mapped is not first] == [True, True, True]
+        first.close()
+
     def test_parse_content_complete(self, indexer):
         """Test complete content parsing with all elements."""
         content = """---
@@ -165,6 +274,18 @@ Final content with #another-tag.
         assert len(parsed.tags) > 0
         assert "python" in parsed.tags or "inline-tag" in parsed.tags
         assert len(parsed.links) > 0
+        assert parsed.word_count == len(parsed.content.split())
+
+    def test_prefetch_entry_stats_tolerates_removed_files(self, indexer, temp_dir):
+        """Test stat prefetching leaves errors to the per-file handling."""
+        for i in range(5):
+            self.create_test_file(temp_dir / f"file{i}.md", f"# File {i}")
+        entries = indexer._scan_directory_entries(temp_dir, recursive=True)
+        (temp_dir / "file3.md").unlink()
+
+        indexer._prefetch_entry_stats(entries, chunk_size=2)
+
+        assert entries[0].stat().st_size > 0
 
     def test_should_index_file_new_file(self, indexer, temp_dir):
         """Test should_index_file for new files."""
@@ -183,6 +304,18 @@ Final content with #another-tag.
         # Unchanged file should not be indexed again
         assert indexer._should_index_file(test_file) is False
 
+    def test_should_index_file_unchanged_skips_hashing(self, indexer, temp_dir, monkeypatch):
+        """Test that matching modification time and size avoid hashing the file."""
+        test_file = self.create_test_file(temp_dir / "test.md", "# Test")
+        indexer.index_file(test_file)
+
+        def fail_hash(file_path):
+            raise AssertionError("content hash should not be computed")
+
+        monkeypatch.setattr(indexer, '_calculate_content_hash', fail_hash)
+
+        assert indexer._should_index_file(test_file) is False
+
     def test_should_index_file_modified(self, indexer, temp_dir):
         """Test should_index_file for modified files."""
         test_file = self.create_test_file(temp_dir / "test.md", "# Test")
@@ -198,6 +331,62 @@ Final content with #another-tag.
         # Modified file should be indexed again
         assert indexer._should_index_file(test_file) is True
 
+    def test_should_index_file_touched_unchanged(self, indexer, temp_dir):
+        """Test a file touched without edits is skipped, and only indexing refreshes its date."""
+        test_file = self.create_test_file(temp_dir / "test.md", "# Test")
+        indexer.index_file(test_file)
+
+        future = test_file.stat().st_mtime + 60
+        os.utime(test_file, (future, future))
+
+        def stored_modified_date():
+            with indexer.db_manager.get_connection() as conn:
+                return conn.execute(
+                    "SELECT modified_date FROM files WHERE path = ?", (str(test_file),)
+                ).fetchone()['modified_date']
+
+        # The check itself leaves the index untouched
+        original_date = stored_modified_date()
+        assert indexer._should_index_file(test_file) is False
+        assert stored_modified_date() == original_date
+
+        stats = indexer.incremental_index_directory(temp_dir)
+        assert stats['files_skipped'] == 1
+        assert stored_modified_date() == datetime.fromtimestamp(future).isoformat()
+
+    def test_reindex_file_replaces_fts_row(self, indexer, temp_dir):
+        """Test re-indexing a changed file leaves a single full-text row keyed by its id."""
+        test_file = self.create_test_file(temp_dir / "test.md", "# Test\n\nfirst version")
+        indexer.index_file(test_file)
+        test_file.write_text("# Test\n\nsecond version, now longer")
+        indexer.index_file(test_file)
+
+        with indexer.db_manager.get_connection() as conn:
+            rows = conn.execute("SELECT rowid, file_id, content FROM content_fts").fetchall()
+            file_id = conn.execute("SELECT id FROM files WHERE path = ?", (str(test_file),)).fetchone()['id']
+
+        assert len(rows) == 1
+        assert rows[0]['rowid'] == rows[0]['file_id'] == file_id
+        assert 'second version' in rows[0]['content']
+
+    def test_index_directory_uses_manifest(self, indexer, temp_dir, monkeypatch):
+        """Test re-indexing a directory checks files against a single manifest query."""
+        self.create_test_file(temp_dir / "file1.md", "# File 1")
+        self.create_test_file(temp_dir / "sub" / "file2.md", "# File 2")
+        indexer.index_directory(temp_dir)
+
+        manifest = indexer._get_index_manifest(temp_dir)
+        assert set(manifest) == {str(temp_dir / "file1.md"), str(temp_dir / "sub" / "file2.md")}
+
+        def fail_lookup(file_path, file_stat=None):
+            raise AssertionError("per-file lookup should not be used")
+
+        monkeypatch.setattr(indexer, '_should_index_file', fail_lookup)
+        stats = indexer.index_directory(temp_dir)
+
+        assert stats['files_skipped'] == 2
+        assert stats['files_processed'] == 0
+
     def test_index_file_success(self, indexer, temp_dir):
         """Test successful file indexing."""
         content = """---
@@ -252,6 +441,129 @@ Test content with #tag and [link](https://example.com).
         # Verify files were indexed
         assert indexer.get_file_count() == 3
 
+    def test_index_directory_parallel(self, indexer, temp_dir):
+        """Test directory indexing with worker processes."""
+        for i in range(6):
+            self.create_test_file(temp_dir / f"file{i}.md", f"---\ntags: [t{i}]\n---\n# File {i}\n\n#inline")
+
+        stats = indexer.index_directory(temp_dir, workers=2)
+
+        assert stats['files_processed'] == 6
+        assert stats['errors'] == 0
+        with indexer.db_manager.get_connection() as conn:
+            tags = sorted(row['tag'] for row in conn.execute("SELECT tag FROM tags"))
+        assert tags == sorted([f"t{i}" for i in range(6)] + ["inline"] * 6)
+
+        # Unchanged files are skipped before any work is sent to the pool
+        stats = indexer.index_directory(temp_dir, workers=2)
+        assert stats['files_skipped'] == 6
+
+    def test_index_directory_rolls_back_failed_file(self, indexer, temp_dir, monkeypatch):
+        """Test that a file failing mid-store is rolled back without losing the batch."""
+        self.create_test_file(temp_dir / "bad.md", "---\ntags: [broken]\n---\n# Bad")
+        self.create_test_file(temp_dir / "good.md", "---\ntags: [fine]\n---\n# Good")
+
+        original_store_obsidian_data = indexer._store_obsidian_data
+
+        def failing_store_obsidian_data(conn, file_id, obsidian_features):
+            row = conn.execute("SELECT filename FROM files WHERE id = ?", (file_id,)).fetchone()
+            if row['filename'] == "bad.md":
+                raise RuntimeError("simulated write failure")
+            original_store_obsidian_data(conn, file_id, obsidian_features)
+
+        monkeypatch.setattr(indexer, '_store_obsidian_data', failing_store_obsidian_data)
+
+        stats = indexer.index_directory(temp_dir)
+
+        assert stats['files_processed'] == 1
+        assert stats['errors'] == 1
+        with indexer.db_manager.get_connection() as conn:
+            assert [row['filename'] for row in conn.execute("SELECT filename FROM files")] == ["good.md"]
+            assert [row['tag'] for row in conn.execute("SELECT tag FROM tags")] == ["fine"]
+            assert not conn.in_transaction
+
+    def test_index_file_rolls_back_failed_file(self, indexer, temp_dir, monkeypatch):
+        """Test that a file failing mid-store outside a batch is not committed later."""
+        import sqlite3
+
+        bad_file = self.create_test_file(temp_dir / "bad.md", "---\ntags: [broken]\n---\n# Bad")
+        good_file = self.create_test_file(temp_dir / "good.md", "---\ntags: [fine]\n---\n# Good")
+
+        original_store_obsidian_data = indexer._store_obsidian_data
+
+        def failing_store_obsidian_data(conn, file_id, obsidian_features):
+            row = conn.execute("SELECT filename FROM files WHERE id = ?", (file_id,)).fetchone()
+            if row['filename'] == "bad.md":
+                raise sqlite3.OperationalError("simulated write failure")
+            original_store_obsidian_data(conn, file_id, obsidian_features)
+
+        monkeypatch.setattr(indexer, '_store_obsidian_data', failing_store_obsidian_data)
+
+        with pytest.raises(IndexingError):
+            indexer.index_file(bad_file)
+        with indexer.db_manager.get_connection() as conn:
+            assert not conn.in_transaction
+
+        assert indexer.index_file(good_file) is True
+        with indexer.db_manager.get_connection() as conn:
+            assert [row['filename'] for row in conn.execute("SELECT filename FROM files")] == ["good.md"]
+            assert [row['tag'] for row in conn.execute("SELECT tag FROM tags")] == ["fine"]
+
+    def test_batched_writes_roll_back_on_error(self, indexer, temp_dir):
+        """Test that an exception escaping a batch commits none of its files."""
+        test_file = self.create_test_file(temp_dir / "test.md", "# Test")
+
+        # The database layer wraps the error, so match on its message
+        with pytest.raises(Exception, match="aborted"):
+            with indexer._batched_writes():
+                indexer.index_file(test_file)
+                raise RuntimeError("aborted")
+
+        assert indexer.get_file_count() == 0
+        with indexer.db_manager.get_connection() as conn:
+            assert not conn.in_transaction
+
+    def test_batched_writes_are_per_thread(self, temp_dir):
+        """Test that a file indexed on another thread never joins this thread's batch."""
+        import threading
+
+        file_a = self.create_test_file(temp_dir / "a.md", "# A")
+        file_b = self.create_test_file(temp_dir / "b.md", "# B")
+
+        db_manager = DatabaseManager(temp_dir / "index.db")
+        db_manager.initialize_database()
+        indexer = Indexer(db_manager)
+
+        batch_open = threading.Event()
+        other_done = threading.Event()
+
+        def index_other():
+            batch_open.wait()
+            try:
+                indexer.index_file(file_b)
+            finally:
+                other_done.set()
+
+        thread = threading.Thread(target=index_other)
+        thread.start()
+
+        # Abort this thread's batch; the other thread's file has its own
+        # transaction, which waits for the write lock and then commits
+        with pytest.raises(Exception, match="aborted"):
+            with indexer._batched_writes():
+                indexer.index_file(file_a)
+                batch_open.set()
+                finished_inside_batch = other_done.wait(timeout=0.5)
+                raise RuntimeError("aborted")
+
+        thread.join(timeout=30)
+
+        assert not finished_inside_batch
+
+        with db_manager.get_connection() as conn:
+            assert [row['filename'] for row in conn.execute("SELECT filename FROM files")] == ["b.md"]
+        db_manager.close()
+
     def test_index_directory_nonexistent(self, indexer):
         """Test indexing nonexistent directory."""
         nonexistent = Path("/nonexistent/directory")
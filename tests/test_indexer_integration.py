@@ -33,10 +33,16 @@ class TestIndexerIntegration:
 
     def create_sample_files(self, base_dir: Path):
         """Create a collection of sample markdown files for testing."""
+        obsidian_note = base_dir / "notes" / "obsidian-note.md"
+        jekyll_post = base_dir / "blog" / "_posts" / "2024-01-15-jekyll-post.md"
+        joplin_note = base_dir / "joplin" / "research-note.md"
+        generic_md = base_dir / "docs" / "README.md"
+
+        # Create each directory once, before writing any file
+        for directory in {path.parent for path in (obsidian_note, jekyll_post, joplin_note, generic_md)}:
+            directory.mkdir(parents=True, exist_ok=True)
 
         # Obsidian-style note
-        obsidian_note = base_dir / "notes" / "obsidian-note.md"
-        obsidian_note.parent.mkdir(parents=True, exist_ok=True)
         obsidian_note.write_text("""---
 title: Obsidian Note Example
 tags: [obsidian, note-taking, productivity]
@@ -59,8 +65,6 @@ Using nested tags like #productivity/tools and #workflow/automation.
 """)
 
         # Jekyll blog post
-        jekyll_post = base_dir / "blog" / "_posts" / "2024-01-15-jekyll-post.md"
-        jekyll_post.parent.mkdir(parents=True, exist_ok=True)
         jekyll_post.write_text("""---
 layout: post
 title: "Jekyll Blog Post"
@@ -101,8 +105,6 @@ This post demonstrates #blogging and #web-development concepts.
 """)
 
         # Joplin note
-        joplin_note = base_dir / "joplin" / "research-note.md"
-        joplin_note.parent.mkdir(parents=True, exist_ok=True)
         joplin_note.write_text("""# Research Note
 
 Created: 2024-01-15T15:30:00Z
@@ -128,8 +130,6 @@ See the [[transformer-implementation]] note for code examples.
 """)
 
         # Generic markdown file
-        generic_md = base_dir / "docs" / "README.md"
-        generic_md.parent.mkdir(parents=True, exist_ok=True)
         generic_md.write_text("""# Project Documentation
 
 This is a generic markdown file without frontmatter.
@@ -391,4 +391,31 @@ class TestLinkParser:
 
         # Both should resolve to the same reference
         assert len(links) == 2
-        assert all(link['link_target'] == 'https://example.com' for link in links)
\ No newline at end of file
+        assert all(link['link_target'] == 'https://example.com' for link in links)
+
+    def test_markdown_links_nested_parentheses(self):
+        """Test targets with nested parentheses and links after an unclosed one."""
+        content = "[a](x.md) [b](wiki/Foo_(bar)) [broken](open [c](y.md)"
+
+        links = self.parser.parse(content)
+
+        targets = [link['link_target'] for link in links]
+        assert targets == ['x.md', 'wiki/Foo_(bar)', 'y.md']
+
+    def test_reference_definition_after_blank_lines(self):
+        """Test reference definitions are found after long runs of blank lines."""
+        content = "[Link][ref]" + "\n" * 5000 + "   [ref]: https://example.com"
+
+        links = self.parser.parse(content)
+
+        assert len(links) == 1
+        assert links[0]['link_target'] == 'https://example.com'
+
+    def test_reference_labels_case_folded(self):
+        """Test reference labels match under Unicode case folding."""
+        content = "See [Straße][] here.\n\n[STRASSE]: https://example.com/strasse"
+
+        links = self.parser.parse(content)
+
+        assert len(links) == 1
+        assert links[0]['link_target'] == 'https://example.com/strasse'
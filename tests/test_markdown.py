@@ -2,39 +2,182 @@
 Unit tests for the markdown content parser.
 """
 
+import re
+
 import pytest
 from mdquery.parsers.markdown import MarkdownParser, HeadingInfo, ParsedMarkdown
 
+# Markdown syntax characters that must not survive into plain text
+_MARKDOWN_SYNTAX_CHARS = frozenset("*~[]()`>-")
+
+# Numbered list markers from the formatting removal fixture
+_NUMBERED_MARKER_PATTERN = re.compile(r"[12]\.")
+
+# Typographic characters the FTS5 sanitizer replaces with ASCII
+_TYPOGRAPHIC_PUNCTUATION = frozenset("\u2014\u2013\u2026")
+_SMART_QUOTES = frozenset("\u201c\u201d\u2018\u2019")
+
+# Fenced code block lines and prose of the test_code_block_removal document
+_CODE_BLOCK_SNIPPET_PATTERN = re.compile(
+    r"def hello\(\):|print\(|Some generic code block|with multiple lines"
+)
+_CODE_BLOCK_KEPT_TEXT = ("Here's some text", "More text here", "inline code")
+
+# (content, expected word count) pairs for test_word_counting
+_WORD_COUNT_CASES = (
+    ("", 0),
+    ("word", 1),
+    ("two words", 2),
+    ("This is a sentence with seven words.", 7),
+    ("Multiple\nlines\nwith\nwords", 4),
+    ("  Spaces   around   words  ", 3),
+    ("Punctuation, doesn't! affect? word: counting.", 5),
+)
+
+# Mixed formatting with no headings, the last of the heading edge cases
+_EDGE_NO_HEADINGS = "Just some **bold** text with *italics* and a [link](url)."
+
+# (content, heading count, first heading text) heading edge cases
+_EDGE_CASES = (
+    ("# ", 0, None),                    # Heading with only hashes
+    ("====", 0, None),                  # Setext underline with no text above
+    ("# Heading #####", 1, "Heading"),  # Heading with trailing hashes
+    (_EDGE_NO_HEADINGS, 0, None),       # Mixed content with no headings
+)
+
+# (level, text, anchor) of each heading in the test_atx_headings document
+_EXPECTED_ATX = (
+    (1, "Main Title", "main-title"),
+    (2, "Section One", "section-one"),
+    (3, "Subsection A", "subsection-a"),
+    (4, "Deep Section", "deep-section"),
+    (5, "Deeper Section", "deeper-section"),
+    (6, "Deepest Section", "deepest-section"),
+    (2, "Section Two", "section-two"),
+)
+
+# Parent path of each heading in the test_heading_hierarchy document
+_EXPECTED_HIERARCHY = {
+    "Chapter 1": [],
+    "Section 1.1": ["Chapter 1"],
+    "Subsection 1.1.1": ["Chapter 1", "Section 1.1"],
+    "Subsection 1.1.2": ["Chapter 1", "Section 1.1"],
+    "Section 1.2": ["Chapter 1"],
+    "Chapter 2": [],
+    "Section 2.1": ["Chapter 2"],
+}
+
+# Anchors of each heading in the test_heading_anchor_generation document
+_EXPECTED_ANCHORS = (
+    "simple-heading",
+    "heading-with-spaces",
+    "heading-with-special-characters",
+    "heading-with-bold-and-italic",
+    "multiple-spaces-between-words",
+)
+
+# Document exercising every kind of inline and block formatting
+_FORMATTING_DOC = """# Heading
+
+This is **bold text** and *italic text* and ~~strikethrough~~.
+
+Here's a [link](http://example.com) and an ![image](image.jpg).
+
+Here's some `inline code` and a [[wikilink]].
+
+> This is a blockquote
+
+- List item 1
+- List item 2
+
+1. Numbered item 1
+2. Numbered item 2"""
+
+# Larger document mixing headings, lists, code blocks and links
+_COMPLEX_DOC = """# Project Documentation
+
+## Overview
+
+This project provides **markdown querying** capabilities.
+
+### Features
+
+- SQL-like queries
+- Multiple output formats
+- Fast indexing
+
+### Installation
+
+1. Clone the repository
+2. Install dependencies: `pip install -r requirements.txt`
+3. Run the application
+
+## Usage Examples
+
+Here's how to use it:
+
+```bash
+mdquery "SELECT * FROM files WHERE tags LIKE '%python%'"
+```
+
+### Advanced Queries
+
+You can also use [complex queries](docs/queries.md) for better results.
+
+> **Note**: Always backup your data before running queries.
+
+## Configuration
+
+The configuration file uses YAML format:
+
+```yaml
+database:
+  path: "./cache.db"
+  timeout: 30
+```
+
+## Conclusion
+
+This tool is useful for [[knowledge management]] and research."""
+
+
+@pytest.fixture(scope="module")
+def parser():
+    """Create one parser shared by every test in the module."""
+    return MarkdownParser()
+
+
+@pytest.fixture(scope="module")
+def complex_result(parser):
+    """Parse the complex document once for the tests that inspect it."""
+    return parser.parse(_COMPLEX_DOC)
+
 
 class TestMarkdownParser:
     """Test cases for MarkdownParser."""
 
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.parser = MarkdownParser()
-
-    def test_empty_content(self):
+    def test_empty_content(self, parser):
         """Test parsing empty content."""
-        result = self.parser.parse("")
+        result = parser.parse("")
         assert result.sanitized_content == ""
         assert result.headings == []
         assert result.word_count == 0
         assert result.heading_hierarchy == {}
         assert result.plain_text == ""
 
-    def test_whitespace_only_content(self):
+    def test_whitespace_only_content(self, parser):
         """Test parsing content with only whitespace."""
-        result = self.parser.parse("   \n\n  \t  ")
+        result = parser.parse("   \n\n  \t  ")
         assert result.sanitized_content == ""
         assert result.headings == []
         assert result.word_count == 0
         assert result.heading_hierarchy == {}
         assert result.plain_text == ""
 
-    def test_simple_text_content(self):
+    def test_simple_text_content(self, parser):
         """Test parsing simple text without markdown."""
         content = "This is a simple paragraph with some words."
-        result = self.parser.parse(content)
+        result = parser.parse(content)
 
         assert result.sanitized_content == content
         assert result.headings == []
@@ -42,7 +185,7 @@ class TestMarkdownParser:
         assert result.heading_hierarchy == {}
         assert result.plain_text == content
 
-    def test_atx_headings(self):
+    def test_atx_headings(self, parser):
         """Test parsing ATX-style headings (# ## ### etc.)."""
         content = """# Main Title
 ## Section One
@@ -52,25 +195,23 @@ class TestMarkdownParser:
 ###### Deepest Section
 ## Section Two"""
 
-        result = self.parser.parse(content)
+        result = parser.parse(content)
 
-        expected_headings = [
-            HeadingInfo(1, "Main Title", "main-title", 1),
-            HeadingInfo(2, "Section One", "section-one", 2),
-            HeadingInfo(3, "Subsection A", "subsection-a", 3),
-            HeadingInfo(4, "Deep Section", "deep-section", 4),
-            HeadingInfo(5, "Deeper Section", "deeper-section", 5),
-            HeadingInfo(6, "Deepest Section", "deepest-section", 6),
-            HeadingInfo(2, "Section Two", "section-two", 7),
-        ]
+        got = tuple((h.level, h.text, h.anchor) for h in result.headings)
+        assert got == _EXPECTED_ATX
+
+    def test_heading_info_is_tuple(self, parser):
+        """Test headings compare and unpack as (level, text, anchor, line_number)."""
+        result = parser.parse("# Title\n\nText\n\n## Sub Section")
 
-        assert len(result.headings) == 7
-        for i, heading in enumerate(expected_headings):
-            assert result.headings[i].level == heading.level
-            assert result.headings[i].text == heading.text
-            assert result.headings[i].anchor == heading.anchor
+        assert result.headings == [
+            HeadingInfo(1, "Title", "title", 1),
+            HeadingInfo(2, "Sub Section", "sub-section", 5),
+        ]
+        level, text, anchor, line_number = result.headings[1]
+        assert (level, text, anchor, line_number) == (2, "Sub Section", "sub-section", 5)
 
-    def test_setext_headings(self):
+    def test_setext_headings(self, parser):
         """Test parsing Setext-style headings (underlined)."""
         content = """Main Title
 ==========
@@ -80,15 +221,14 @@ Section Title
 
 Some content here."""
 
-        result = self.parser.parse(content)
+        result = parser.parse(content)
 
-        assert len(result.headings) == 2
-        assert result.headings[0].level == 1
-        assert result.headings[0].text == "Main Title"
-        assert result.headings[1].level == 2
-        assert result.headings[1].text == "Section Title"
+        assert [(h.level, h.text) for h in result.headings] == [
+            (1, "Main Title"),
+            (2, "Section Title"),
+        ]
 
-    def test_mixed_heading_styles(self):
+    def test_mixed_heading_styles(self, parser):
         """Test parsing mixed ATX and Setext headings."""
         content = """# ATX Heading 1
 
@@ -102,16 +242,17 @@ Setext Heading 2
 
 ### ATX Heading 3"""
 
-        result = self.parser.parse(content)
+        result = parser.parse(content)
 
-        assert len(result.headings) == 5
-        assert result.headings[0].text == "ATX Heading 1"
-        assert result.headings[1].text == "Setext Heading 1"
-        assert result.headings[2].text == "ATX Heading 2"
-        assert result.headings[3].text == "Setext Heading 2"
-        assert result.headings[4].text == "ATX Heading 3"
+        assert [h.text for h in result.headings] == [
+            "ATX Heading 1",
+            "Setext Heading 1",
+            "ATX Heading 2",
+            "Setext Heading 2",
+            "ATX Heading 3",
+        ]
 
-    def test_heading_hierarchy(self):
+    def test_heading_hierarchy(self, parser):
         """Test building heading hierarchy."""
         content = """# Chapter 1
 ## Section 1.1
@@ -121,51 +262,18 @@ Setext Heading 2
 # Chapter 2
 ## Section 2.1"""
 
-        result = self.parser.parse(content)
+        result = parser.parse(content)
 
-        hierarchy = result.heading_hierarchy
-        assert hierarchy["Chapter 1"] == []
-        assert hierarchy["Section 1.1"] == ["Chapter 1"]
-        assert hierarchy["Subsection 1.1.1"] == ["Chapter 1", "Section 1.1"]
-        assert hierarchy["Subsection 1.1.2"] == ["Chapter 1", "Section 1.1"]
-        assert hierarchy["Section 1.2"] == ["Chapter 1"]
-        assert hierarchy["Chapter 2"] == []
-        assert hierarchy["Section 2.1"] == ["Chapter 2"]
+        assert result.heading_hierarchy == _EXPECTED_HIERARCHY
 
-    def test_markdown_formatting_removal(self):
+    def test_markdown_formatting_removal(self, parser):
         """Test removal of markdown formatting from plain text."""
-        content = """# Heading
-
-This is **bold text** and *italic text* and ~~strikethrough~~.
-
-Here's a [link](http://example.com) and an ![image](image.jpg).
-
-Here's some `inline code` and a [[wikilink]].
-
-> This is a blockquote
-
-- List item 1
-- List item 2
-
-1. Numbered item 1
-2. Numbered item 2"""
-
-        result = self.parser.parse(content)
+        result = parser.parse(_FORMATTING_DOC)
 
         # Check that markdown formatting is removed from plain text
         plain_text = result.plain_text
-        assert "**" not in plain_text
-        assert "*" not in plain_text
-        assert "~~" not in plain_text
-        assert "[" not in plain_text
-        assert "]" not in plain_text
-        assert "(" not in plain_text
-        assert ")" not in plain_text
-        assert "`" not in plain_text
-        assert ">" not in plain_text
-        assert "-" not in plain_text
-        assert "1." not in plain_text
-        assert "2." not in plain_text
+        assert _MARKDOWN_SYNTAX_CHARS.isdisjoint(plain_text)
+        assert _NUMBERED_MARKER_PATTERN.search(plain_text) is None
 
         # Check that actual text content is preserved
         assert "bold text" in plain_text
@@ -179,7 +287,7 @@ Here's some `inline code` and a [[wikilink]].
         assert "List item 1" in plain_text
         assert "Numbered item 1" in plain_text
 
-    def test_code_block_removal(self):
+    def test_code_block_removal(self, parser):
         """Test removal of code blocks from plain text."""
         content = """# Code Examples
 
@@ -199,115 +307,58 @@ with multiple lines
 
 And `inline code` too."""
 
-        result = self.parser.parse(content)
+        result = parser.parse(content)
 
         plain_text = result.plain_text
-        assert "def hello():" not in plain_text
-        assert "print(" not in plain_text
-        assert "Some generic code block" not in plain_text
-        assert "with multiple lines" not in plain_text
+        assert _CODE_BLOCK_SNIPPET_PATTERN.search(plain_text) is None
 
         # Regular text should be preserved
-        assert "Here's some text" in plain_text
-        assert "More text here" in plain_text
-        assert "inline code" in plain_text
+        assert all(snippet in plain_text for snippet in _CODE_BLOCK_KEPT_TEXT)
 
-    def test_word_counting(self):
+    @pytest.mark.parametrize("content,expected_count", _WORD_COUNT_CASES)
+    def test_word_counting(self, parser, content, expected_count):
         """Test word counting functionality."""
-        test_cases = [
-            ("", 0),
-            ("word", 1),
-            ("two words", 2),
-            ("This is a sentence with seven words.", 7),
-            ("Multiple\nlines\nwith\nwords", 4),
-            ("  Spaces   around   words  ", 3),
-            ("Punctuation, doesn't! affect? word: counting.", 5),
+        result = parser.parse(content)
+        assert result.word_count == expected_count
+
+    def test_complex_doc_headings(self, complex_result):
+        """Test headings of a complex document with various elements."""
+        assert [heading.text for heading in complex_result.headings] == [
+            "Project Documentation",
+            "Overview",
+            "Features",
+            "Installation",
+            "Usage Examples",
+            "Advanced Queries",
+            "Configuration",
+            "Conclusion",
         ]
 
-        for content, expected_count in test_cases:
-            result = self.parser.parse(content)
-            assert result.word_count == expected_count, f"Failed for: '{content}'"
-
-    def test_complex_document_structure(self):
-        """Test parsing a complex document with various elements."""
-        content = """# Project Documentation
-
-## Overview
-
-This project provides **markdown querying** capabilities.
-
-### Features
-
-- SQL-like queries
-- Multiple output formats
-- Fast indexing
-
-### Installation
-
-1. Clone the repository
-2. Install dependencies: `pip install -r requirements.txt`
-3. Run the application
-
-## Usage Examples
-
-Here's how to use it:
-
-```bash
-mdquery "SELECT * FROM files WHERE tags LIKE '%python%'"
-```
-
-### Advanced Queries
-
-You can also use [complex queries](docs/queries.md) for better results.
-
-> **Note**: Always backup your data before running queries.
-
-## Configuration
-
-The configuration file uses YAML format:
-
-```yaml
-database:
-  path: "./cache.db"
-  timeout: 30
-```
-
-## Conclusion
-
-This tool is useful for [[knowledge management]] and research."""
-
-        result = self.parser.parse(content)
-
-        # Check headings
-        assert len(result.headings) == 8
-        assert result.headings[0].text == "Project Documentation"
-        assert result.headings[1].text == "Overview"
-        assert result.headings[2].text == "Features"
-        assert result.headings[3].text == "Installation"
-        assert result.headings[4].text == "Usage Examples"
-        assert result.headings[5].text == "Advanced Queries"
-        assert result.headings[6].text == "Configuration"
-        assert result.headings[7].text == "Conclusion"
-
-        # Check hierarchy
-        hierarchy = result.heading_hierarchy
+    def test_complex_doc_hierarchy(self, complex_result):
+        """Test the heading hierarchy of a complex document."""
+        hierarchy = complex_result.heading_hierarchy
         assert hierarchy["Overview"] == ["Project Documentation"]
         assert hierarchy["Features"] == ["Project Documentation", "Overview"]
         assert hierarchy["Installation"] == ["Project Documentation", "Overview"]
 
-        # Check word count (should be reasonable)
-        assert result.word_count > 50
+    def test_complex_doc_word_count(self, complex_result):
+        """Test the word count of a complex document is reasonable."""
+        assert complex_result.word_count > 50
 
-        # Check that code blocks are removed from plain text (but inline code content is preserved)
-        assert "SELECT * FROM" not in result.plain_text  # This was in a code block
-        assert "database:" not in result.plain_text  # This was in a YAML code block
-        assert "pip install" in result.plain_text  # This was inline code, content should be preserved
+    def test_complex_doc_plain_text(self, complex_result):
+        """Test plain text of a complex document drops code blocks but keeps text."""
+        plain_text = complex_result.plain_text
 
-        # Check that regular text is preserved
-        assert "markdown querying" in result.plain_text
-        assert "knowledge management" in result.plain_text
+        # Code blocks are removed, inline code content is preserved
+        assert "SELECT * FROM" not in plain_text  # This was in a code block
+        assert "database:" not in plain_text  # This was in a YAML code block
+        assert "pip install" in plain_text  # This was inline code, content should be preserved
 
-    def test_special_characters_sanitization(self):
+        # Regular text is preserved
+        assert "markdown querying" in plain_text
+        assert "knowledge management" in plain_text
+
+    def test_special_characters_sanitization(self, parser):
         """Test sanitization of special characters for FTS5."""
         content = """# Smart Quotes Test
 
@@ -317,35 +368,28 @@ It also has em-dashes — and en-dashes – and ellipses…
 
 Some unicode: café, naïve, résumé."""
 
-        result = self.parser.parse(content)
+        result = parser.parse(content)
 
         sanitized = result.sanitized_content
         # Regular quotes should be preserved (this content doesn't have smart quotes)
         assert '"' in sanitized
         assert "'" in sanitized
 
-        # Dashes should be normalized
-        assert '—' not in sanitized
-        assert '–' not in sanitized
-
-        # Ellipses should be normalized
-        assert '…' not in sanitized
+        # Dashes and ellipses should be normalized
+        assert _TYPOGRAPHIC_PUNCTUATION.isdisjoint(sanitized)
         assert '...' in sanitized
 
         # Test actual smart quotes replacement with unicode characters
         smart_quote_content = "This has \u201creal smart quotes\u201d and \u2018smart apostrophes\u2019."
-        smart_result = self.parser.parse(smart_quote_content)
+        smart_result = parser.parse(smart_quote_content)
         smart_sanitized = smart_result.sanitized_content
         # Smart quotes should be converted to regular quotes
-        assert '\u201c' not in smart_sanitized  # Left double quote should be gone
-        assert '\u201d' not in smart_sanitized  # Right double quote should be gone
-        assert '\u2018' not in smart_sanitized  # Left single quote should be gone
-        assert '\u2019' not in smart_sanitized  # Right single quote should be gone
+        assert _SMART_QUOTES.isdisjoint(smart_sanitized)
         # Regular quotes should be present instead
         assert '"' in smart_sanitized
         assert "'" in smart_sanitized
 
-    def test_heading_anchor_generation(self):
+    def test_heading_anchor_generation(self, parser):
         """Test anchor generation for headings."""
         content = """# Simple Heading
 ## Heading with Spaces
@@ -353,20 +397,11 @@ Some unicode: café, naïve, résumé."""
 #### Heading with **Bold** and *Italic*
 ##### Multiple    Spaces    Between    Words"""
 
-        result = self.parser.parse(content)
+        result = parser.parse(content)
 
-        expected_anchors = [
-            "simple-heading",
-            "heading-with-spaces",
-            "heading-with-special-characters",
-            "heading-with-bold-and-italic",
-            "multiple-spaces-between-words"
-        ]
-
-        for i, expected_anchor in enumerate(expected_anchors):
-            assert result.headings[i].anchor == expected_anchor
+        assert tuple(h.anchor for h in result.headings) == _EXPECTED_ANCHORS
 
-    def test_utility_methods(self):
+    def test_utility_methods(self, parser):
         """Test utility methods for heading manipulation."""
         content = """# Main Title
 ## Section One
@@ -375,50 +410,66 @@ Some unicode: café, naïve, résumé."""
 ### Another Subsection
 #### Deep Section"""
 
-        result = self.parser.parse(content)
+        result = parser.parse(content)
 
         # Test get_heading_text_only
-        heading_texts = self.parser.get_heading_text_only(result.headings)
+        heading_texts = parser.get_heading_text_only(result.headings)
         expected_texts = ["Main Title", "Section One", "Subsection", "Section Two", "Another Subsection", "Deep Section"]
         assert heading_texts == expected_texts
 
         # Test get_headings_by_level
-        h1_headings = self.parser.get_headings_by_level(result.headings, 1)
-        assert len(h1_headings) == 1
-        assert h1_headings[0].text == "Main Title"
+        h1_headings = parser.get_headings_by_level(result.headings, 1)
+        assert [h.text for h in h1_headings] == ["Main Title"]
 
-        h2_headings = self.parser.get_headings_by_level(result.headings, 2)
-        assert len(h2_headings) == 2
-        assert h2_headings[0].text == "Section One"
-        assert h2_headings[1].text == "Section Two"
+        h2_headings = parser.get_headings_by_level(result.headings, 2)
+        assert [h.text for h in h2_headings] == ["Section One", "Section Two"]
 
-        h3_headings = self.parser.get_headings_by_level(result.headings, 3)
+        h3_headings = parser.get_headings_by_level(result.headings, 3)
         assert len(h3_headings) == 2
 
-        h4_headings = self.parser.get_headings_by_level(result.headings, 4)
-        assert len(h4_headings) == 1
-        assert h4_headings[0].text == "Deep Section"
-
-    def test_edge_cases(self):
-        """Test various edge cases."""
-        # Heading with only hashes
-        result = self.parser.parse("# ")
-        assert len(result.headings) == 0
-
-        # Invalid setext heading (no text above)
-        result = self.parser.parse("====")
-        assert len(result.headings) == 0
-
-        # Heading with trailing hashes
-        result = self.parser.parse("# Heading #####")
-        assert len(result.headings) == 1
-        assert result.headings[0].text == "Heading"
-
-        # Mixed content with no headings
-        content = "Just some **bold** text with *italics* and a [link](url)."
-        result = self.parser.parse(content)
-        assert len(result.headings) == 0
+        h4_headings = parser.get_headings_by_level(result.headings, 4)
+        assert [h.text for h in h4_headings] == ["Deep Section"]
+
+    @pytest.mark.parametrize(
+        "content,heading_count,first_heading",
+        _EDGE_CASES,
+        ids=["empty-hash", "orphan-setext", "trailing-hashes", "no-headings"]
+    )
+    def test_edge_cases(self, parser, content, heading_count, first_heading):
+        """Test heading detection edge cases."""
+        result = parser.parse(content)
+        assert len(result.headings) == heading_count
+        if first_heading is not None:
+            assert result.headings[0].text == first_heading
+
+    def test_edge_no_headings_keeps_text(self, parser):
+        """Test mixed content with no headings keeps its text."""
+        result = parser.parse(_EDGE_NO_HEADINGS)
         assert result.word_count > 0
         assert "bold" in result.plain_text
         assert "italics" in result.plain_text
-        assert "link" in result.plain_text
\ No newline at end of file
+        assert "link" in result.plain_text
+
+    def test_to_html(self, parser):
+        """Test on-demand HTML rendering."""
+        html = parser.to_html("# Title\n\nSome **bold** text.")
+
+        assert "<h1" in html
+        assert "<strong>bold</strong>" in html
+
+        # The parser state is reset between renders
+        assert "Title" not in parser.to_html("Plain paragraph.")
+
+    def test_count_words(self, parser):
+        """Test word counting matches splitting on whitespace."""
+        samples = [
+            "",
+            "   ",
+            "Test content for searching",
+            "  leading and trailing  ",
+            "tabs\tand\nnewlines\r\nand\x0bvertical\x1cseparators",
+            "caf\u00e9 na\u00efve\u00a0non-breaking\u2003em-space",
+        ]
+
+        for text in samples:
+            assert parser.count_words(text) == len(text.split())
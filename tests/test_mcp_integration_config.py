@@ -8,7 +8,6 @@ to ensure proper initialization and functionality.
 import tempfile
 import pytest
 from pathlib import Path
-from unittest.mock import patch, MagicMock
 
 from mdquery.config import SimplifiedConfig
 from mdquery.mcp import MDQueryMCPServer, MCPServerError
@@ -108,14 +107,16 @@ class TestMCPServerIntegration:
         assert server.db_path.parent.exists()
         assert server.cache_dir.exists()
 
-    @patch('mdquery.mcp.MDQueryMCPServer._initialize_components_with_retry')
-    def test_mcp_server_initialization_error_handling(self, mock_init, tmp_path):
+    def test_mcp_server_initialization_error_handling(self, tmp_path, monkeypatch):
         """Test error handling during MCP server initialization."""
         notes_dir = tmp_path / "notes"
         notes_dir.mkdir()
 
-        # Mock initialization to raise an exception
-        mock_init.side_effect = Exception("Initialization failed")
+        # Make initialization raise an exception
+        def failing_init(self):
+            raise Exception("Initialization failed")
+
+        monkeypatch.setattr(MDQueryMCPServer, "_initialize_components_with_retry", failing_init)
 
         config = SimplifiedConfig(notes_dir=notes_dir)
         server = MDQueryMCPServer(config=config)
@@ -218,6 +219,7 @@ class TestMCPServerIntegration:
 
         config = SimplifiedConfig(notes_dir=notes_dir)
         server = MDQueryMCPServer(config=config)
+        server._initialization_retry_delay = 0  # Retry without backing off
 
         # Mock the core initialization to fail on first attempt, succeed on second
         original_init = server._initialize_core_components
@@ -249,6 +251,7 @@ class TestMCPServerIntegration:
 
         config = SimplifiedConfig(notes_dir=notes_dir)
         server = MDQueryMCPServer(config=config)
+        server._initialization_retry_delay = 0  # Retry without backing off
 
         # Mock the core initialization to always fail
         def mock_init():
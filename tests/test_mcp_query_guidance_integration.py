@@ -14,20 +14,7 @@ from unittest.mock import AsyncMock, MagicMock
 from mdquery.mcp import MDQueryMCPServer
 from mdquery.config import SimplifiedConfig
 
-
-class TestMCPQueryGuidanceIntegration:
-    """Test MCP server integration for query guidance tools."""
-
-    @pytest.fixture
-    def mcp_server(self, tmp_path):
-        """Create a test MCP server with simplified configuration."""
-        # Create test notes directory
-        notes_dir = tmp_path / "notes"
-        notes_dir.mkdir()
-
-        # Create a simple test file
-        test_file = notes_dir / "test.md"
-        test_file.write_text("""---
+_TEST_NOTE_BYTES = b"""---
 title: Test Note
 tags: [ai, llm, coding]
 ---
@@ -37,28 +24,53 @@ tags: [ai, llm, coding]
 This is a test note about AI development.
 
 #mcp #agent #automation
-""")
+"""
 
-        # Create simplified config
-        config = SimplifiedConfig(
-            notes_dir=str(notes_dir),
-            auto_index=True
-        )
 
-        # Create MCP server
-        server = MDQueryMCPServer(config=config)
+@pytest.fixture(scope="module")
+def mcp_server(tmp_path_factory):
+    """
+    Create one test MCP server with simplified configuration for the module.
+
+    The query guidance tools only read from the server, so every test can
+    share the same notes directory, database and server.
+    """
+    # Create test notes directory
+    notes_dir = tmp_path_factory.mktemp("guidance") / "notes"
+    notes_dir.mkdir()
+
+    # Create a simple test file
+    test_file = notes_dir / "test.md"
+    test_file.write_bytes(_TEST_NOTE_BYTES)
+
+    # Create simplified config
+    config = SimplifiedConfig(
+        notes_dir=str(notes_dir),
+        auto_index=True
+    )
+
+    # Create MCP server
+    server = MDQueryMCPServer(config=config)
+
+    # Mock the server.run method to avoid actually starting the server
+    server.run = AsyncMock()
 
-        # Mock the server.run method to avoid actually starting the server
-        server.run = AsyncMock()
+    # Initialize the server components once, up front, so the tests
+    # never wait on the lazy initialization path
+    server._initialize_components_with_retry()
 
-        return server
+    yield server
+
+    server.executor.shutdown(wait=True)
+    server.db_manager.close()
+
+
+class TestMCPQueryGuidanceIntegration:
+    """Test MCP server integration for query guidance tools."""
 
     @pytest.mark.asyncio
     async def test_get_query_guidance_tool(self, mcp_server):
         """Test the get_query_guidance MCP tool."""
-        # Initialize the server components
-        await mcp_server._ensure_initialized()
-
         # Find the get_query_guidance tool
         guidance_tool = None
         for tool_name, tool_func in mcp_server.server._tools.items():
@@ -97,9 +109,6 @@ This is a test note about AI development.
     @pytest.mark.asyncio
     async def test_get_query_templates_tool(self, mcp_server):
         """Test the get_query_templates MCP tool."""
-        # Initialize the server components
-        await mcp_server._ensure_initialized()
-
         # Find the get_query_templates tool
         templates_tool = None
         for tool_name, tool_func in mcp_server.server._tools.items():
@@ -137,9 +146,6 @@ This is a test note about AI development.
     @pytest.mark.asyncio
     async def test_get_query_optimization_suggestions_tool(self, mcp_server):
         """Test the get_query_optimization_suggestions MCP tool."""
-        # Initialize the server components
-        await mcp_server._ensure_initialized()
-
         # Find the optimization tool
         optimization_tool = None
         for tool_name, tool_func in mcp_server.server._tools.items():
@@ -180,9 +186,6 @@ This is a test note about AI development.
     @pytest.mark.asyncio
     async def test_get_query_syntax_reference_tool(self, mcp_server):
         """Test the get_query_syntax_reference MCP tool."""
-        # Initialize the server components
-        await mcp_server._ensure_initialized()
-
         # Find the syntax reference tool
         syntax_tool = None
         for tool_name, tool_func in mcp_server.server._tools.items():
@@ -225,9 +228,6 @@ This is a test note about AI development.
     @pytest.mark.asyncio
     async def test_workflow_analysis_guidance(self, mcp_server):
         """Test getting guidance specifically for workflow analysis."""
-        # Initialize the server components
-        await mcp_server._ensure_initialized()
-
         # Find the get_query_guidance tool
         guidance_tool = None
         for tool_name, tool_func in mcp_server.server._tools.items():
@@ -257,9 +257,6 @@ This is a test note about AI development.
     @pytest.mark.asyncio
     async def test_template_complexity_filtering(self, mcp_server):
         """Test filtering templates by complexity level."""
-        # Initialize the server components
-        await mcp_server._ensure_initialized()
-
         # Find the get_query_templates tool
         templates_tool = None
         for tool_name, tool_func in mcp_server.server._tools.items():
@@ -293,9 +290,6 @@ This is a test note about AI development.
     @pytest.mark.asyncio
     async def test_optimization_for_good_query(self, mcp_server):
         """Test optimization suggestions for a well-optimized query."""
-        # Initialize the server components
-        await mcp_server._ensure_initialized()
-
         # Find the optimization tool
         optimization_tool = None
         for tool_name, tool_func in mcp_server.server._tools.items():
@@ -323,6 +323,20 @@ class TestTagParser(unittest.TestCase):
         expected = ['another/valid_tag', 'data/science/ml', 'programming/python', 'valid/tag']
         self.assertEqual(result, expected)
 
+    def test_normalize_inline_tags_matches_parse(self):
+        """Test normalizing pre-scanned matches gives the same tags as parsing."""
+        content = "Tags: #Python #web-dev #x #123 #tag- #programming/python #python"
+
+        matches = self.parser.hashtag_pattern.findall(content)
+        self.assertEqual(
+            self.parser.normalize_inline_tags(matches),
+            self.parser.parse_inline_tags(content)
+        )
+        self.assertEqual(
+            self.parser.normalize_inline_tags(matches),
+            ['programming/python', 'python', 'web-dev']
+        )
+
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file